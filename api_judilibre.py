@@ -12,24 +12,62 @@ Remarques :
    et d’outils d’intelligence artificielle.
 """
 
+import copy
 import os
 import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from dotenv import load_dotenv
 
+import api_piste
+
+# Clés conservées par JudilibreAPI.clean()
+_ALLOWED_KEYS = frozenset({
+    "text" , "id", "jurisdiction", "chamber", "formation", "type", "theme",
+    "publication","decision_date","solution","jurisdiction","score"
+})
+
+# Juridictions interrogées par défaut par JudilibreAPI.search()
+_DEFAULT_JURISDICTIONS = ("cc", "ca", "tj", "tcom")
+
+# Nombre maximal d'entrées de chacun des caches mémoire de JudilibreAPI (taxonomies, décisions)
+_CACHE_MAX_ENTRIES = 256
+# Durée de validité par défaut (en secondes) des entrées de ces caches
+_CACHE_TTL = 3600
+
+# Taxonomies disponibles, retournées par JudilibreAPI.taxonomy() sans paramètre
+_TAXONOMY_DESCRIPTIONS = {
+    "type": "Types de décision (arrêt, ordonnance, QPC, etc.)",
+    "jurisdiction": "Juridictions (Cour de cassation, cours d'appel, tribunaux, etc.)",
+    "chamber": "Chambres de la Cour de cassation (civile, sociale, criminelle, etc.)",
+    "formation": "Formations des juridictions",
+    "publication": "Niveaux de publication (bulletin, rapport, lettre, etc.)",
+    "theme": "Matières juridiques (nomenclature Cour de cassation)",
+    "solution": "Types de solution (cassation, rejet, annulation, etc.)",
+    "field": "Champs et zones de contenu (exposé, moyens, motivations, dispositif, etc.)",
+    "zones": "Zones de contenu des décisions",
+    "location": "Codes des sièges de juridiction (cours d'appel, tribunaux)",
+    "filetype": "Types de documents associés (rapports, avis, communiqués, etc.)",
+}
+
+
 class JudilibreAPI:
     """
     Client OAuth pour l'API JudiLibre
     """
 
-    def __init__(self, sandbox: bool = True):
+    def __init__(self, sandbox: bool = True, cache_ttl: float = _CACHE_TTL):
         """
         Initialise le client OAuth
 
         Args:
-            client_id: Identifiant client fourni par Légifrance
-            client_secret: Secret client fourni par Légifrance
+            sandbox: Utiliser l'environnement sandbox de PISTE. Défaut: True
+            cache_ttl: Durée de validité (en secondes) des taxonomies et décisions gardées
+                en mémoire par le client. 0 désactive ces caches (utile lorsque l'appelant
+                a ses propres caches, comme le serveur MCP). Défaut: 3600
         """
         load_dotenv(verbose=False)
         if sandbox:
@@ -48,6 +86,44 @@ class JudilibreAPI:
         # Stockage du token
         self.access_token = None
         self.token_expires_at = None
+        # Une seule demande de token à la fois, même si plusieurs threads démarrent ensemble
+        self._token_lock = threading.RLock()
+
+        # Cache disque du token, partagé entre processus et exécutions successives
+        # (une entrée par couple de credentials et par environnement sandbox/production)
+        self.token_cache_path = api_piste.token_cache_path(
+            self.client_id, self.client_secret, self.token_url
+        )
+
+        # Caches mémoire des réponses stables : taxonomies et décisions (voir clear_cache())
+        # Chaque entrée est un couple (expiration, valeur)
+        self.cache_ttl = cache_ttl
+        self._taxonomy_cache: Dict[tuple, Any] = {}
+        self._decision_cache: Dict[tuple, Any] = {}
+        self._cache_lock = threading.Lock()
+
+        # Session HTTP partagée par tous les appels (pool keep-alive, réessais : voir api_piste).
+        # Ne pas revenir à requests.get/post, qui ouvrent une nouvelle connexion à chaque appel.
+        self.session = api_piste.new_session("judilibre")
+
+    def _load_cached_token(self) -> bool:
+        """
+        Recharge le token depuis le cache disque s'il est encore valide (voir api_piste)
+
+        Returns:
+            True si un token valide a été chargé
+        """
+        cached = api_piste.load_cached_token(self.token_cache_path)
+        if cached is None:
+            return False
+        self.access_token, self.token_expires_at = cached
+        return True
+
+    def _save_cached_token(self) -> None:
+        """
+        Enregistre le token dans le cache disque (voir api_piste)
+        """
+        api_piste.save_cached_token(self.token_cache_path, self.access_token, self.token_expires_at)
 
     def get_access_token(self) -> str:
         """
@@ -61,32 +137,51 @@ class JudilibreAPI:
             if datetime.now() < self.token_expires_at:
                 return self.access_token
 
-        data = {
-            "Accept-Encoding": "gzip,deflate",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Host": self.token_url.replace("https://", "").split("/")[0],
-            "Connection": "Keep-Alive",
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": "openid",
-        }
+        with self._token_lock:
+            # Un autre thread a pu obtenir le token pendant l'attente du verrou
+            if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
+                return self.access_token
 
-        try:
-            response = requests.post(self.token_url, data=data)
-            response.raise_for_status()
+            # Token obtenu par un autre processus ou lors d'une exécution précédente
+            if self._load_cached_token():
+                return self.access_token
 
-            token_data = response.json()
-            self.access_token = token_data["access_token"]
+            data = {
+                "Accept-Encoding": "gzip,deflate",
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Host": self.token_url.replace("https://", "").split("/")[0],
+                "Connection": "Keep-Alive",
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": "openid",
+            }
 
-            # Calculer l'expiration du token (avec marge de sécurité)
-            expires_in = token_data.get("expires_in", 3600)
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+            try:
+                response = self.session.post(self.token_url, data=data)
+                response.raise_for_status()
 
-            return self.access_token
+                token_data = response.json()
+                self.access_token = token_data["access_token"]
 
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Erreur lors de l'obtention du token: {e}")
+                # Calculer l'expiration du token (avec marge de sécurité)
+                expires_in = token_data.get("expires_in", 3600)
+                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+                self._save_cached_token()
+
+                return self.access_token
+
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Erreur lors de l'obtention du token: {e}")
+
+    def prime(self) -> None:
+        """
+        Obtient le token d'accès immédiatement plutôt qu'à la première requête.
+
+        Utile avant une série d'appels parallèles ou de mesures de temps : le premier
+        appel ne paie plus la demande de token.
+        """
+        self.get_access_token()
 
     def _get_api_headers(self) -> Dict[str, str]:
         """
@@ -106,7 +201,7 @@ class JudilibreAPI:
         theme: Optional[List[str]] = None,
         chamber: Optional[List[str]] = None,
         formation: Optional[List[str]] = None,
-        jurisdiction: Optional[List[str]] = ["cc", "ca", "tj", "tcom"], # Par défaut toutes les juridictions
+        jurisdiction: Optional[Sequence[str]] = _DEFAULT_JURISDICTIONS, # Par défaut toutes les juridictions
         location: Optional[List[str]] = None,
         publication: Optional[List[str]] = None,
         solution: Optional[List[str]] = None,
@@ -284,7 +379,7 @@ class JudilibreAPI:
             params["withFileOfType"] = withFileOfType
 
         try:
-            response = requests.get(endpoint, headers=self._get_api_headers(), params=params)
+            response = self.session.get(endpoint, headers=self._get_api_headers(), params=params)
             response.raise_for_status()
             json = response.json()
             return self.clean(json)
@@ -300,6 +395,7 @@ class JudilibreAPI:
         resolve_references: bool = False,
         query: Optional[str] = None,
         operator: str = "and",
+        clean: bool = True,
     ) -> Any:
         """
         Permet de récupérer le contenu intégral d'une décision.
@@ -354,6 +450,8 @@ class JudilibreAPI:
             operator: Opérateur logique reliant les multiples termes que le paramètre query
                      peut contenir (or par défaut, and ou exact – dans ce dernier cas le
                      moteur recherchera exactement le contenu du paramètre query).
+            clean: Nettoyer la réponse avec clean() (par défaut True). Avec False, la réponse
+                   brute est retournée, y compris les positions des zones (zones.*.start/end).
 
         Returns:
             Dict contenant la décision complète (type decisionFull)
@@ -388,6 +486,12 @@ class JudilibreAPI:
         if operator not in ["or", "and", "exact"]:
             raise ValueError("operator doit être 'or', 'and' ou 'exact'")
 
+        # Réponse brute déjà reçue pour les mêmes paramètres
+        cache_key = (decision_id, resolve_references, query, operator if query else None)
+        cached = self._cache_get(self._decision_cache, cache_key)
+        if cached is not None:
+            return self.clean(cached) if clean else cached
+
         endpoint = f"{self.api_url}/decision"
         params = {
             "id": decision_id,
@@ -400,10 +504,11 @@ class JudilibreAPI:
             params["operator"] = operator
 
         try:
-            response = requests.get(endpoint, headers=self._get_api_headers(), params=params)
+            response = self.session.get(endpoint, headers=self._get_api_headers(), params=params)
             response.raise_for_status()
             json = response.json()
-            return self.clean(json)
+            self._cache_put(self._decision_cache, cache_key, json)
+            return self.clean(json) if clean else copy.deepcopy(json)
 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Erreur lors de la récupération de la décision '{decision_id}'")
@@ -470,8 +575,8 @@ class JudilibreAPI:
 
         Returns:
             Données de taxonomie (le format varie selon les paramètres) :
-            - Si aucun paramètre : List[Dict[str, str]] avec format enrichi
-              [{"key": "type", "description": "Types de décision ..."}, ...]
+            - Si aucun paramètre : Dict[str, str] associant chaque taxonomie à sa description
+              {"type": "Types de décision ...", "jurisdiction": "Juridictions ...", ...}
             - Si taxonomy_id seul : liste complète des termes de cette taxonomie
               (format original de l'API)
             - Si key fourni : Dict avec {"key": "cc", "value": "Cour de cassation"}
@@ -482,14 +587,14 @@ class JudilibreAPI:
             Exception: Erreurs de requête API
 
         Examples:
-            # Lister toutes les taxonomies disponibles (FORMAT ENRICHI)
+            # Lister toutes les taxonomies disponibles avec leur description
             all_taxonomies = api.taxonomy()
-            # → [
-            #     {"key": "type", "description": "Types de décision (arrêt, ordonnance, QPC, etc.)"},
-            #     {"key": "jurisdiction", "description": "Juridictions (Cour de cassation, ...)"},
-            #     {"key": "chamber", "description": "Chambres de la Cour de cassation ..."},
+            # → {
+            #     "type": "Types de décision (arrêt, ordonnance, QPC, etc.)",
+            #     "jurisdiction": "Juridictions (Cour de cassation, ...)",
+            #     "chamber": "Chambres de la Cour de cassation ...",
             #     ...
-            # ]
+            # }
 
             # Obtenir toutes les juridictions
             jurisdictions = api.taxonomy("jurisdiction")
@@ -543,29 +648,24 @@ class JudilibreAPI:
             params["context_value"] = context_value
 
         if not params:
-            # Aucun paramètre fourni : laisser l'appel API retourner la liste complète des taxonomies
-            TAXONOMY_DESCRIPTIONS = {
-                "type": "Types de décision (arrêt, ordonnance, QPC, etc.)",
-                "jurisdiction": "Juridictions (Cour de cassation, cours d'appel, tribunaux, etc.)",
-                "chamber": "Chambres de la Cour de cassation (civile, sociale, criminelle, etc.)",
-                "formation": "Formations des juridictions",
-                "publication": "Niveaux de publication (bulletin, rapport, lettre, etc.)",
-                "theme": "Matières juridiques (nomenclature Cour de cassation)",
-                "solution": "Types de solution (cassation, rejet, annulation, etc.)",
-                "field": "Champs et zones de contenu (exposé, moyens, motivations, dispositif, etc.)",
-                "zones": "Zones de contenu des décisions",
-                "location": "Codes des sièges de juridiction (cours d'appel, tribunaux)",
-                "filetype": "Types de documents associés (rapports, avis, communiqués, etc.)",
-            }
-            return TAXONOMY_DESCRIPTIONS
+            # Aucun paramètre fourni : taxonomies disponibles et leur description, sans appel API.
+            # Copie superficielle : l'appelant peut modifier le résultat sans altérer la constante
+            return dict(_TAXONOMY_DESCRIPTIONS)
+
+        # Les taxonomies évoluent rarement : réponse mise en cache pour la durée de vie du client
+        cache_key = (taxonomy_id, key, value, context_value)
+        cached = self._cache_get(self._taxonomy_cache, cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = requests.get(endpoint, headers=self._get_api_headers(), params=params)
+            response = self.session.get(endpoint, headers=self._get_api_headers(), params=params)
             response.raise_for_status()
             json = response.json()
             # Un tableau est retourné si plusieurs décisions sont demandées, à défaut le réponse complète
             result = json.get("result", json)
-            return result
+            self._cache_put(self._taxonomy_cache, cache_key, result)
+            return copy.deepcopy(result)
 
         except requests.exceptions.RequestException as e:
             if taxonomy_id:
@@ -575,6 +675,76 @@ class JudilibreAPI:
             else:
                 raise Exception(f"Erreur lors de la récupération des taxonomies: {e}")
 
+    def clear_cache(self) -> None:
+        """
+        Vide les caches mémoire des taxonomies et des décisions
+        """
+        with self._cache_lock:
+            self._taxonomy_cache.clear()
+            self._decision_cache.clear()
+
+    def _cache_get(self, cache: Dict[tuple, Any], key: tuple) -> Any:
+        """
+        Retourne une copie de l'entrée du cache (l'appelant peut la modifier),
+        ou None si absente ou expirée
+        """
+        if self.cache_ttl <= 0:
+            return None
+        with self._cache_lock:
+            item = cache.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del cache[key]
+                return None
+        return copy.deepcopy(value)
+
+    def _cache_put(self, cache: Dict[tuple, Any], key: tuple, value: Any) -> None:
+        """
+        Ajoute une entrée au cache ; la plus ancienne est évincée si le cache est plein
+        """
+        if self.cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            if key not in cache and len(cache) >= _CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+            cache[key] = (time.monotonic() + self.cache_ttl, value)
+
+    def taxonomy_many(self, specs: List[Dict[str, Any]], max_workers: int = 8) -> List[Any]:
+        """
+        Récupère plusieurs taxonomies en parallèle.
+
+        Les requêtes sont émises simultanément afin que la latence totale soit proche
+        de celle de la requête la plus lente plutôt que de la somme des allers-retours.
+
+        Args:
+            specs: Liste de paramètres de taxonomy(), un dict par appel
+                (ex: {"taxonomy_id": "chamber", "context_value": "tcom"})
+            max_workers: Nombre maximum de requêtes simultanées. Défaut: 8
+
+        Returns:
+            Liste des résultats, dans l'ordre des specs fournies
+
+        Raises:
+            ValueError: Si les paramètres d'une spec sont invalides
+            Exception: Si l'une des requêtes échoue
+
+        Examples:
+            locations, jurisdictions = api.taxonomy_many([
+                {"taxonomy_id": "location", "context_value": "tcom"},
+                {"taxonomy_id": "jurisdiction"},
+            ])
+        """
+        if not specs:
+            return []
+
+        # Obtenir le token une seule fois avant de lancer les requêtes en parallèle
+        self.get_access_token()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+            return list(executor.map(lambda spec: self.taxonomy(**spec), specs))
+
 
     def clean(self, x, depth=0, max_depth=5):
             """
@@ -586,28 +756,27 @@ class JudilibreAPI:
             Returns:
                 dict or list: Structure nettoyée avec uniquement les clés autorisées.
             """
-            # Liste des clés à conserver
-            allowed_keys = {
-                "text" , "id", "jurisdiction", "chamber", "formation", "type", "theme",
-                "publication","decision_date","solution","jurisdiction","score"
-            }
-
             # Arrêter la descente si on a atteint la profondeur maximale
             if depth >= max_depth:
                 return None
 
+            # Méthode liée une seule fois pour les appels récursifs de la boucle
+            clean = self.clean
+
             if isinstance(x, dict):
                 cleaned = {}
                 for k, v in x.items():
-                    if v:  # Ignorer les valeurs vides
-                        if k in allowed_keys and not isinstance(v, (dict, list)):
-                            # Clé autorisée : conserver la valeur
-                            cleaned[k] = v
-                        elif isinstance(v, (dict, list)):
-                            # Valeur est dict/list : descendre dans la hiérarchie
-                            cleaned_value = self.clean(v, depth + 1, max_depth)
-                            if cleaned_value:  # Ne garder que si le résultat n'est pas vide
-                                cleaned[k] = cleaned_value
+                    if not v:  # Ignorer les valeurs vides
+                        continue
+                    # Un seul test de type par valeur
+                    if isinstance(v, (dict, list)):
+                        # Valeur est dict/list : descendre dans la hiérarchie
+                        cleaned_value = clean(v, depth + 1, max_depth)
+                        if cleaned_value:  # Ne garder que si le résultat n'est pas vide
+                            cleaned[k] = cleaned_value
+                    elif k in _ALLOWED_KEYS:
+                        # Clé autorisée : conserver la valeur
+                        cleaned[k] = v
                 return cleaned if cleaned else None
 
             if isinstance(x, list):
@@ -615,7 +784,7 @@ class JudilibreAPI:
                 if x and all(isinstance(item, str) for item in x):
                     return x
                 # Sinon, traiter récursivement
-                l = [cleaned_v for v in x if v and (cleaned_v := self.clean(v, depth + 1, max_depth)) is not None]
+                l = [cleaned_v for v in x if v and (cleaned_v := clean(v, depth + 1, max_depth)) is not None]
                 return l if l else None
 
             return x
@@ -14,10 +14,32 @@ Remarques :
 
 import os
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from dotenv import load_dotenv
-from api_legifrance_query_builder import LegifranceQueryBuilder
+
+import api_piste
+from api_legifrance_query_builder import LegifranceQueryBuilder, _MAX_PAGE_SIZE
+
+# Clés conservées à tous les niveaux de la hiérarchie par LegifranceAPI.clean()
+_ALLOWED_KEYS = frozenset({
+    "id", "title", "text", "values", "datePublication", "startDate",
+    "origine", "nature", "natureJuridiction", "solution", "numeroAffaire",
+    "president", "avocats", "titre", "texte", "juridiction", "content"
+})
+
+
+def _strip_highlight(text: str) -> str:
+    """
+    Supprime les balises de surlignage <mark> ajoutées par le moteur de recherche
+    """
+    # str.replace sur des littéraux est plus rapide qu'une expression régulière
+    if "<mark>" not in text:
+        return text
+    return text.replace("<mark>", "").replace("</mark>", "")
+
 
 class LegifranceAPI:
     """
@@ -62,6 +84,39 @@ class LegifranceAPI:
         # Stockage du token
         self.access_token = None
         self.token_expires_at = None
+        # Une seule demande de token à la fois, même si plusieurs threads démarrent ensemble
+        self._token_lock = threading.RLock()
+
+        # Cache disque du token, partagé entre processus et exécutions successives
+        # (une entrée par couple de credentials et par environnement sandbox/production)
+        self.token_cache_path = api_piste.token_cache_path(
+            self.client_id, self.client_secret, self.token_url
+        )
+
+        # Session HTTP partagée par tous les appels (pool keep-alive, réessais : voir api_piste).
+        # Ne pas revenir à requests.get/post, qui ouvrent une nouvelle connexion à chaque appel.
+        # Les recherches et consultations Légifrance sont des POST sans effet de bord :
+        # elles peuvent être réessayées.
+        self.session = api_piste.new_session("legifrance", retry_methods=("GET", "POST"))
+
+    def _load_cached_token(self) -> bool:
+        """
+        Recharge le token depuis le cache disque s'il est encore valide (voir api_piste)
+
+        Returns:
+            True si un token valide a été chargé
+        """
+        cached = api_piste.load_cached_token(self.token_cache_path)
+        if cached is None:
+            return False
+        self.access_token, self.token_expires_at = cached
+        return True
+
+    def _save_cached_token(self) -> None:
+        """
+        Enregistre le token dans le cache disque (voir api_piste)
+        """
+        api_piste.save_cached_token(self.token_cache_path, self.access_token, self.token_expires_at)
 
     def get_access_token(self) -> str:
         """
@@ -75,35 +130,54 @@ class LegifranceAPI:
             if datetime.now() < self.token_expires_at:
                 return self.access_token
 
-        # Headers pour la requête OAuth
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-        }
+        with self._token_lock:
+            # Un autre thread a pu obtenir le token pendant l'attente du verrou
+            if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
+                return self.access_token
 
-        # Données de la requête OAuth 2.0 Client Credentials
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": "openid",
-        }
+            # Token obtenu par un autre processus ou lors d'une exécution précédente
+            if self._load_cached_token():
+                return self.access_token
 
-        try:
-            response = requests.post(self.token_url, headers=headers, data=data)
-            response.raise_for_status()
+            # Headers pour la requête OAuth
+            headers = {
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Accept": "application/json",
+            }
+
+            # Données de la requête OAuth 2.0 Client Credentials
+            data = {
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": "openid",
+            }
 
-            token_data = response.json()
-            self.access_token = token_data["access_token"]
+            try:
+                response = self.session.post(self.token_url, headers=headers, data=data)
+                response.raise_for_status()
 
-            # Calculer l'expiration du token (avec marge de sécurité)
-            expires_in = token_data.get("expires_in", 3600)
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+                token_data = response.json()
+                self.access_token = token_data["access_token"]
 
-            return self.access_token
+                # Calculer l'expiration du token (avec marge de sécurité)
+                expires_in = token_data.get("expires_in", 3600)
+                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+                self._save_cached_token()
 
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Erreur lors de l'obtention du token: {e}")
+                return self.access_token
+
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Erreur lors de l'obtention du token: {e}")
+
+    def prime(self) -> None:
+        """
+        Obtient le token d'accès immédiatement plutôt qu'à la première requête.
+
+        Utile avant une série d'appels parallèles ou de mesures de temps : le premier
+        appel ne paie plus la demande de token.
+        """
+        self.get_access_token()
 
     def _get_api_headers(self) -> Dict[str, str]:
         """
@@ -165,7 +239,7 @@ class LegifranceAPI:
         endpoint = f"{self.api_url}/search/ping"
 
         try:
-            response = requests.get(endpoint, headers=self._get_api_headers())
+            response = self.session.get(endpoint, headers=self._get_api_headers())
             response.raise_for_status()
             return response.text.strip()
         except requests.exceptions.HTTPError as e:
@@ -304,8 +378,6 @@ class LegifranceAPI:
             Exception: Si la requête échoue ou si les paramètres sont invalides
 
         """
-        endpoint = f"{self.api_url}/search"
-
         # Mode simple : construire la requête à partir des paramètres
         if query is None:
             raise ValueError("Le paramètre 'recherche' doit être fourni")
@@ -371,8 +443,114 @@ class LegifranceAPI:
         # Construire le payload final
         payload = queryBuilder.build()
 
+        return self._post_search(payload, clean)
+
+    def search_iter(
+        self, page_size: int = 10, max_pages: Optional[int] = None, **kwargs: Any
+    ) -> Iterator[Any]:
+        """
+        Parcourt les pages de résultats d'une recherche, en préchargeant la page suivante.
+
+        Pendant que l'appelant exploite une page, la suivante est déjà demandée en arrière-plan :
+        chaque next() après le premier ne paie plus l'aller-retour réseau. Le parcours s'arrête
+        sur une page vide ou incomplète, ou après max_pages pages.
+
+        Args:
+            page_size: Nombre de résultats par page (limité à 50). Défaut: 10
+            max_pages: Nombre maximum de pages parcourues. Défaut: toutes
+            **kwargs: Paramètres de search() (query, fond, code, ...), hors page_number
+
+        Yields:
+            Une page de résultats, au format de search()
+
+        Raises:
+            ValueError: Si page_number est fourni (la pagination est gérée par search_iter)
+            Exception: Si l'une des recherches échoue
+
+        Examples:
+            >>> pages = api.search_iter(query="crédit", fond="JORF", page_size=5)
+            >>> first = next(pages)
+            >>> second = next(pages)  # déjà reçue pendant l'exploitation de la première
+        """
+        if "page_number" in kwargs:
+            raise ValueError("page_number est géré par search_iter et ne doit pas être fourni")
+        page_size = min(page_size, _MAX_PAGE_SIZE)
+
+        def fetch(page_number: int) -> Any:
+            return self.search(page_number=page_number, page_size=page_size, **kwargs)
+
+        # Obtenir le token avant de lancer le préchargement en arrière-plan
+        self.get_access_token()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page_number = 1
+            future = executor.submit(fetch, page_number)
+            while True:
+                page = future.result()
+                results = page.get("results") if isinstance(page, dict) else None
+                if not results:
+                    return
+
+                last = len(results) < page_size or (max_pages is not None and page_number >= max_pages)
+                if not last:
+                    future = executor.submit(fetch, page_number + 1)
+                yield page
+                if last:
+                    return
+                page_number += 1
+
+    def submit_many(
+        self,
+        queries: List[Dict[str, Any]],
+        clean: bool = True,
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Envoie plusieurs requêtes de recherche déjà construites en parallèle.
+
+        Les requêtes sont émises simultanément afin que la latence totale soit proche
+        de celle de la requête la plus lente plutôt que de la somme des allers-retours.
+
+        Args:
+            queries: Liste de requêtes au format SearchRequestDTO (résultat de
+                LegifranceQueryBuilder.build()).
+            clean: Nettoyer les réponses (voir clean()). Défaut: True
+            max_workers: Nombre maximum de requêtes simultanées. Défaut: 8
+            return_exceptions: Retourner l'exception d'une requête en échec à sa place dans
+                la liste au lieu de la lever (utile pour un balayage de combinaisons). Défaut: False
+
+        Returns:
+            Liste des résultats, dans l'ordre des requêtes fournies
+
+        Raises:
+            Exception: Si l'une des requêtes échoue et que return_exceptions vaut False
+        """
+        if not queries:
+            return []
+
+        # Obtenir le token une seule fois avant de lancer les requêtes en parallèle
+        self.get_access_token()
+
+        def post(payload: Dict[str, Any]) -> Any:
+            try:
+                return self._post_search(payload, clean)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(post, queries))
+
+    def _post_search(self, payload: Dict[str, Any], clean: bool = True) -> Any:
+        """
+        Envoie une requête SearchRequestDTO à l'endpoint /search
+        """
+        endpoint = f"{self.api_url}/search"
+
         try:
-            response = requests.post(endpoint, headers=self._get_api_headers(), json=payload)
+            response = self.session.post(endpoint, headers=self._get_api_headers(), json=payload)
             response.raise_for_status()
             json = response.json()
             summary = self.clean(json) if clean else json
@@ -404,9 +582,9 @@ class LegifranceAPI:
             # Ajouter les en-têtes de réponse pour le débogage
             error_msg += f"\n\nEn-têtes de réponse: {dict(e.response.headers)}"
 
-            raise Exception(f"Erreur lors de la recherche: {error_msg}")
+            raise Exception(f"Erreur lors de la recherche: {error_msg}") from e
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Erreur lors de la recherche: {e}")
+            raise Exception(f"Erreur lors de la recherche: {e}") from e
 
     def consult(self, id_: str, clean: bool = True) -> Any:
         """
@@ -465,7 +643,7 @@ class LegifranceAPI:
             params = {"textCid": id_}
 
         try:
-            response = requests.post(endpoint, headers=self._get_api_headers(), json=params)
+            response = self.session.post(endpoint, headers=self._get_api_headers(), json=params)
             response.raise_for_status()
             api_response = self.clean( response.json() ) if clean else response.json()
             return api_response
@@ -473,12 +651,48 @@ class LegifranceAPI:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Erreur lors de la récupération de l'article")
 
+    def consult_many(
+        self, ids: List[str], clean: bool = True, max_workers: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Récupère plusieurs documents en parallèle.
+
+        L'API Légifrance n'offre pas de consultation groupée : les appels à consult()
+        sont émis simultanément, la latence totale est proche de celle de l'appel le plus lent.
+
+        Args:
+            ids: Identifiants des documents (voir consult())
+            clean: Nettoyer les réponses (voir clean()). Défaut: True
+            max_workers: Nombre maximum de requêtes simultanées. Défaut: 8
+
+        Returns:
+            Dictionnaire identifiant -> document, dans l'ordre des identifiants fournis
+
+        Raises:
+            Exception: Si l'une des consultations échoue
+
+        Examples:
+            >>> docs = api.consult_many(["LEGIARTI000006422500", "JURITEXT000045940024"])
+            >>> article = docs["LEGIARTI000006422500"]
+        """
+        if not ids:
+            return {}
+
+        # Obtenir le token une seule fois avant de lancer les requêtes en parallèle
+        self.get_access_token()
+
+        unique_ids = list(dict.fromkeys(ids))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            documents = executor.map(lambda id_: self.consult(id_, clean), unique_ids)
+            return dict(zip(unique_ids, documents))
+
 
 
     def clean(self, x, depth=0, max_depth=8):
         """
         Nettoie un dictionnaire ou une liste en ne conservant que les clés autorisées à tous les niveaux
         de la hiérarchie et en supprimant les valeurs None ou vides.
+        Les balises de surlignage <mark> des textes conservés sont retirées.
         La descente dans la hiérarchie est limitée à max_depth niveaux (par défaut 4).
 
         Clés conservées: id, title, text, values, datePublication, startDate, origine, nature,
@@ -492,37 +706,35 @@ class LegifranceAPI:
         Returns:
             dict or list: Structure nettoyée avec uniquement les clés autorisées à tous les niveaux.
         """
-        # Liste des clés à conserver à tous les niveaux de la hiérarchie
-        allowed_keys = {
-            "id", "title", "text", "values", "datePublication", "startDate",
-            "origine", "nature", "natureJuridiction", "solution", "numeroAffaire",
-            "president", "avocats", "titre", "texte", "juridiction", "content"
-        }
-
         # Arrêter la descente si on a atteint la profondeur maximale
         if depth >= max_depth:
             return None
 
+        # Méthode liée une seule fois pour les appels récursifs de la boucle
+        clean = self.clean
+
         if isinstance(x, dict):
             cleaned = {}
             for k, v in x.items():
-                if v:  # Ignorer les valeurs vides
-                    if k in allowed_keys and not isinstance(v, (dict, list)):
-                        # Clé autorisée : conserver la valeur
-                        cleaned[k] = v
-                    elif isinstance(v, (dict, list)):
-                        # Valeur est dict/list : descendre dans la hiérarchie
-                        cleaned_value = self.clean(v, depth + 1, max_depth)
-                        if cleaned_value:  # Ne garder que si le résultat n'est pas vide
-                            cleaned[k] = cleaned_value
+                if not v:  # Ignorer les valeurs vides
+                    continue
+                # dict/list : descente ; le test str (surlignage) n'a lieu que pour les clés conservées
+                if isinstance(v, (dict, list)):
+                    # Valeur est dict/list : descendre dans la hiérarchie
+                    cleaned_value = clean(v, depth + 1, max_depth)
+                    if cleaned_value:  # Ne garder que si le résultat n'est pas vide
+                        cleaned[k] = cleaned_value
+                elif k in _ALLOWED_KEYS:
+                    # Clé autorisée : conserver la valeur
+                    cleaned[k] = _strip_highlight(v) if isinstance(v, str) else v
             return cleaned if cleaned else None
 
         if isinstance(x, list):
-            # Si la liste contient uniquement des chaînes de caractères, la garder intacte
+            # Si la liste contient uniquement des chaînes de caractères, la garder (sans surlignage)
             if x and all(isinstance(item, str) for item in x):
-                return x
+                return [_strip_highlight(item) for item in x]
             # Sinon, traiter récursivement
-            l = [cleaned_v for v in x if v and (cleaned_v := self.clean(v, depth + 1, max_depth)) is not None]
+            l = [cleaned_v for v in x if v and (cleaned_v := clean(v, depth + 1, max_depth)) is not None]
             return l if l else None
 
         return x
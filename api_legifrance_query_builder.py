@@ -13,12 +13,26 @@ Remarques :
 """
 
 import json
+import re
+import sys
 from typing import Any, Dict, List, Optional
 
+# Normalisation des valeurs de facettes numériques : "1880", 1880, " IDCC 1880 " -> "1880"
+# Les IDCC comptent jusqu'à 4 chiffres (zéros initiaux compris, ex: "0016") ; 5 chiffres
+# sont tolérés pour ne pas bloquer une éventuelle extension de la numérotation
+_IDCC_RE = re.compile(r"\s*(?:IDCC[\s:]*)?(\d{1,5})\s*", re.IGNORECASE)
+_ANNEE_RE = re.compile(r"\s*(\d{4})\s*")
+_NUMERIC_FACETS = {"IDCC": (_IDCC_RE, "IDCC 1880 ou 1880"), "ANNEE": (_ANNEE_RE, "2020")}
+
+# Taille de page maximale acceptée par l'API
+_MAX_PAGE_SIZE = 50
+
 
 class LegifranceQueryBuilder:
     """Générateur de requêtes pour l'API Légifrance"""
 
+    __slots__ = ("query",)
+
     # Constantes pour les types de recherche
     TYPE_RECHERCHE = {
         "UN_DES_MOTS": "UN_DES_MOTS",
@@ -367,6 +381,41 @@ class LegifranceQueryBuilder:
             },
         }
 
+    @classmethod
+    def from_dict(cls, query: Dict[str, Any]) -> "LegifranceQueryBuilder":
+        """
+        Crée un générateur à partir d'une requête SearchRequestDTO déjà construite.
+
+        Le dictionnaire est repris tel quel, sans copie ni validation : utile pour
+        rejouer une requête mise en cache ou produite par ailleurs.
+
+        Args:
+            query (Dict): Requête au format SearchRequestDTO (voir build())
+
+        Returns:
+            LegifranceQueryBuilder: Instance encapsulant la requête fournie
+
+        Examples:
+            >>> search = LegifranceQueryBuilder.from_dict({"fond": "JORF", "recherche": {...}})
+            >>> search.set_pagination(page_number=2, page_size=10).build()
+        """
+        builder = cls.__new__(cls)
+        builder.query = query
+        return builder
+
+    @classmethod
+    def from_json(cls, query: str) -> "LegifranceQueryBuilder":
+        """
+        Crée un générateur à partir d'une requête SearchRequestDTO sérialisée en JSON.
+
+        Args:
+            query (str): Requête au format JSON (voir to_json())
+
+        Returns:
+            LegifranceQueryBuilder: Instance encapsulant la requête fournie
+        """
+        return cls.from_dict(json.loads(query))
+
     def set_fond(self, fond: str) -> "LegifranceQueryBuilder":
         """
         Définit le fonds de recherche.
@@ -404,7 +453,9 @@ class LegifranceQueryBuilder:
             raise ValueError(
                 f"Fonds invalide. Utilisez une des valeurs: {list(self.FONDS.values())}"
             )
-        self.query["fond"] = fond
+        # Les noms de fonds et de facettes servent de clés répétées : les interner
+        # rend les comparaisons et les recherches dans les dictionnaires moins coûteuses
+        self.query["fond"] = sys.intern(fond)
         return self
 
     def add_field(
@@ -688,9 +739,14 @@ class LegifranceQueryBuilder:
         Returns:
             LegifranceQueryBuilder: Instance pour chaînage des méthodes
 
+        Raises:
+            ValueError: Si une valeur IDCC ou ANNEE est mal formée (ex: "IDCC 18a6")
+
         Note:
             - Plusieurs filtres peuvent être ajoutés. Ils seront combinés avec un opérateur ET.
             - Les facettes disponibles varient selon le fonds recherché.
+            - Les valeurs des facettes IDCC ("1880", 1880, "IDCC 1880") et ANNEE (2020, "2020")
+              sont normalisées ; une valeur mal formée lève ValueError.
             - Consultez d'abord les résultats d'une recherche pour voir les facettes disponibles
               et leurs valeurs possibles dans le contexte de votre fonds.
 
@@ -711,6 +767,21 @@ class LegifranceQueryBuilder:
             >>> # Filtrer par ministère (JORF)
             >>> search.add_filtre_valeurs("MINISTERE", ["Ministère de la Justice"])
         """
+        # Normalisation des facettes numériques. Une valeur mal formée est rejetée : l'ignorer
+        # élargirait silencieusement la recherche au lieu de signaler la faute de frappe
+        if facette in _NUMERIC_FACETS:
+            pattern, exemple = _NUMERIC_FACETS[facette]
+            normalized = []
+            for v in valeurs:
+                m = pattern.fullmatch(str(v))
+                if not m:
+                    raise ValueError(f"Valeur {facette} invalide: '{v}' (attendu: {exemple})")
+                normalized.append(m.group(1))
+            valeurs = normalized
+
+        if isinstance(facette, str):
+            facette = sys.intern(facette)
+
         filtre = {"facette": facette, "valeurs": valeurs}
         self.query["recherche"]["filtres"].append(filtre)
         return self
@@ -794,6 +865,7 @@ class LegifranceQueryBuilder:
 
             page_size (int, optional): Nombre d'éléments par page.
                 Défaut: 10
+                Minimum: 1
                 Maximum: 50 (la valeur sera automatiquement limitée à 50 si dépassée)
 
             type_pagination (str, optional): Type de pagination.
@@ -810,6 +882,9 @@ class LegifranceQueryBuilder:
         Returns:
             LegifranceQueryBuilder: Instance pour chaînage des méthodes
 
+        Raises:
+            ValueError: Si la taille de page est inférieure à 1
+
         Examples:
             >>> search = LegifranceQueryBuilder()
             >>> # Pagination standard : 50 résultats par page, page 1
@@ -817,9 +892,15 @@ class LegifranceQueryBuilder:
             >>> # Aller à la page 3 avec 25 résultats par page
             >>> search.set_pagination(page_number=3, page_size=25)
         """
-        self.query["recherche"]["pageNumber"] = page_number
-        self.query["recherche"]["pageSize"] = min(page_size, 50)  # Max 50
-        self.query["recherche"]["typePagination"] = type_pagination
+        if page_size > _MAX_PAGE_SIZE:
+            page_size = _MAX_PAGE_SIZE
+        elif page_size < 1:
+            raise ValueError("La taille de page doit être au moins 1")
+
+        recherche = self.query["recherche"]
+        recherche["pageNumber"] = page_number
+        recherche["pageSize"] = page_size
+        recherche["typePagination"] = type_pagination
         return self
 
     def set_operator(self, operator: str) -> "LegifranceQueryBuilder":
@@ -903,9 +984,10 @@ class LegifranceQueryBuilder:
             >>> # Tri par date de publication, puis par date de signature
             >>> search.set_sort("DATE_PUBLI_DESC", "SIGNATURE_DATE_DESC")
         """
-        self.query["recherche"]["sort"] = sort
+        recherche = self.query["recherche"]
+        recherche["sort"] = sort
         if second_sort:
-            self.query["recherche"]["secondSort"] = second_sort
+            recherche["secondSort"] = second_sort
         return self
 
     def set_advanced_search(self, advanced: bool = True) -> "LegifranceQueryBuilder":
@@ -987,7 +1069,7 @@ class LegifranceQueryBuilder:
         Args:
             indent (int, optional): Nombre d'espaces pour l'indentation du JSON.
                 Défaut: 2
-                Utilisez None pour obtenir un JSON compact sans indentation.
+                Utilisez None pour obtenir un JSON compact sans indentation ni espaces.
 
         Returns:
             str: Chaîne JSON représentant la requête de recherche,
@@ -1010,7 +1092,8 @@ class LegifranceQueryBuilder:
               }
             }
         """
-        return json.dumps(self.build(), indent=indent, ensure_ascii=False)
+        separators = (",", ":") if indent is None else None
+        return json.dumps(self.build(), indent=indent, separators=separators, ensure_ascii=False)
 
     def reset(self) -> "LegifranceQueryBuilder":
         """
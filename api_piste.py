@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fonctions communes aux clients des API PISTE (Légifrance et JudiLibre).
+
+Copyright (c) 2025 Jean-Michel Tanguy
+Licensed under the MIT License (see LICENSE file)
+
+Remarques :
+   Le cache disque des tokens OAuth est partagé entre processus et exécutions successives,
+   avec une entrée par couple de credentials et par environnement (sandbox/production).
+   Il est désactivé par la variable d'environnement DROIT_FRANCAIS_MCP_NO_CACHE.
+   new_session() fabrique la session HTTP (pool, réessais, cache HTTP optionnel) des deux clients.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Répertoire des caches disque (tokens OAuth, cache HTTP optionnel)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "droit_francais_mcp")
+
+
+def token_cache_path(
+    client_id: Optional[str], client_secret: Optional[str], token_url: str
+) -> Optional[str]:
+    """
+    Chemin du fichier de cache du token pour ces credentials.
+
+    Args:
+        client_id: Identifiant client PISTE
+        client_secret: Secret client PISTE
+        token_url: URL du serveur OAuth (distingue sandbox et production)
+
+    Returns:
+        Chemin du fichier, ou None si les credentials sont absents ou si le cache est désactivé
+    """
+    if not client_id or not client_secret or os.getenv("DROIT_FRANCAIS_MCP_NO_CACHE"):
+        return None
+    key = hashlib.sha256(f"{client_id}:{client_secret}:{token_url}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"token_{key[:32]}.json")
+
+
+def load_cached_token(path: Optional[str]) -> Optional[Tuple[str, datetime]]:
+    """
+    Recharge un token depuis le cache disque s'il est encore valide
+
+    Args:
+        path: Fichier de cache (voir token_cache_path), ou None
+
+    Returns:
+        (token, expiration), ou None si le fichier est absent, illisible ou le token expiré
+    """
+    if not path:
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        access_token = cached["access_token"]
+        expires_at = datetime.fromtimestamp(cached["expires_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if datetime.now() >= expires_at:
+        return None
+    return access_token, expires_at
+
+
+def save_cached_token(path: Optional[str], access_token: str, expires_at: datetime) -> None:
+    """
+    Enregistre un token dans le cache disque (fichier lisible par le seul utilisateur).
+    L'écriture passe par un fichier temporaire renommé (os.replace) : un autre processus
+    ne lit jamais un fichier à moitié écrit. Les erreurs d'écriture sont ignorées.
+
+    Args:
+        path: Fichier de cache (voir token_cache_path), ou None (rien n'est écrit)
+        access_token: Token d'accès
+        expires_at: Date d'expiration du token
+    """
+    if not path:
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"access_token": access_token, "expires_at": expires_at.timestamp()}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def new_session(name: str, retry_methods: Optional[Iterable[str]] = None) -> requests.Session:
+    """
+    Crée la session HTTP d'un client PISTE.
+
+    La session est partagée par tous les appels du client : le pool de connexions garde les
+    connexions TCP/TLS ouvertes (keep-alive) d'un appel à l'autre. Les erreurs transitoires
+    (429, 5xx) sont réessayées avec un délai croissant ; l'en-tête Retry-After du serveur
+    est respecté.
+
+    Avec DROIT_FRANCAIS_MCP_HTTP_CACHE=1, les réponses de l'API sont conservées une heure
+    dans une base SQLite locale (requests-cache) : utile pour relancer un notebook
+    d'exploration sans refaire les mêmes appels. Les réponses expirées sont revalidées
+    plutôt que retéléchargées lorsque le serveur le permet. Les demandes de token ne
+    sont jamais mises en cache.
+
+    Args:
+        name: Nom de la base de cache (une par API)
+        retry_methods: Méthodes HTTP réessayées (défaut urllib3 : méthodes idempotentes, sans POST)
+
+    Returns:
+        requests.Session: Session standard, ou CachedSession si le cache HTTP est activé
+
+    Raises:
+        ImportError: Si le cache HTTP est demandé sans que requests-cache soit installé
+    """
+    if not os.getenv("DROIT_FRANCAIS_MCP_HTTP_CACHE") or os.getenv("DROIT_FRANCAIS_MCP_NO_CACHE"):
+        session = requests.Session()
+    else:
+        session = _new_cached_session(name)
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                # Après le dernier essai, la réponse en erreur est retournée telle quelle
+                # pour que raise_for_status() produise le message détaillé habituel
+                raise_on_status=False,
+                allowed_methods=(
+                    Retry.DEFAULT_ALLOWED_METHODS if retry_methods is None else frozenset(retry_methods)
+                ),
+            ),
+        ),
+    )
+    return session
+
+
+def _new_cached_session(name: str) -> requests.Session:
+    """
+    Crée une session requests-cache (voir new_session)
+
+    Args:
+        name: Nom de la base de cache
+
+    Returns:
+        requests.Session: CachedSession adossée à une base SQLite du répertoire de cache
+
+    Raises:
+        ImportError: Si requests-cache n'est pas installé
+    """
+    try:
+        from requests_cache import CachedSession
+    except ImportError:
+        raise ImportError(
+            "DROIT_FRANCAIS_MCP_HTTP_CACHE nécessite requests-cache : pip install requests-cache"
+        )
+
+    return CachedSession(
+        os.path.join(CACHE_DIR, f"http_{name}.sqlite"),
+        backend="sqlite",
+        expire_after=3600,
+        # Les en-têtes Cache-Control du serveur priment sur expire_after, et une réponse expirée
+        # portant un ETag ou un Last-Modified est revalidée par une requête conditionnelle (304)
+        cache_control=True,
+        allowable_methods=("GET", "POST"),
+        # Le token change d'une session à l'autre : il ne doit pas entrer dans la clé de cache
+        match_headers=False,
+        filter_fn=lambda response: "/oauth" not in response.url,
+    )
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures partagées par les tests des API Légifrance et JudiLibre.
+
+Les clients sont créés une seule fois pour toute la session pytest : le token OAuth est
+obtenu à la création du client, hors de toute cassette VCR, puis réutilisé par tous les
+modules de test. Aucune cassette ne dépend ainsi de l'ordre d'exécution des tests
+(test isolé avec -k, workers xdist, ordre des modules différent).
+Avec pytest-xdist (pytest -n auto), chaque worker est un processus distinct qui crée
+ses propres clients et obtient son propre token : aucun état n'est partagé entre workers.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from api_judilibre import JudilibreAPI
+from api_legifrance import LegifranceAPI
+
+# Aucun cache disque pendant les tests : en rejeu, le token factice des cassettes ("REDACTED")
+# serait enregistré sous les vrais credentials sandbox et servi ensuite aux appels réels.
+# Doit être défini avant la création des clients (fixtures de session ci-dessous).
+os.environ.setdefault("DROIT_FRANCAIS_MCP_NO_CACHE", "1")
+
+# test_jupyter.py est un notebook d'exploration (cellules #%%) sans tests :
+# son import appellerait les API réelles lors de la collecte
+collect_ignore = ["test_jupyter.py"]
+
+
+# Token masqué dans les cassettes (voir _scrub_token), utilisé tel quel en rejeu
+_REPLAY_TOKEN = "REDACTED"
+
+
+def _prime_token(api, record_mode):
+    """
+    Fournit son token au client de session avant l'ouverture de la première cassette.
+
+    En rejeu (--vcr-record=none), le token factice suffit : l'en-tête Authorization n'est pas
+    enregistré et ne sert pas à retrouver les réponses. Sinon le vrai token est demandé ;
+    sans credentials ni réseau, le token factice permet encore de rejouer les cassettes existantes.
+
+    Args:
+        api: Client JudilibreAPI ou LegifranceAPI
+        record_mode: Valeur de --vcr-record (None si l'option n'est pas fournie)
+
+    Returns:
+        Le client, avec un token valide une heure
+    """
+    if record_mode != "none":
+        try:
+            api.prime()
+            return api
+        except Exception:
+            pass
+    api.access_token = _REPLAY_TOKEN
+    api.token_expires_at = datetime.now() + timedelta(hours=1)
+    return api
+
+
+def _scrub_token(response):
+    """Masque le token OAuth dans les réponses enregistrées par VCR.py."""
+    body = response["body"]["string"]
+    if b"access_token" in body:
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return response
+        data["access_token"] = _REPLAY_TOKEN
+        response["body"]["string"] = json.dumps(data).encode("utf-8")
+    return response
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """
+    Configuration de pytest-vcr pour les tests marqués vcr (tests d'intégration).
+
+    Au premier lancement, les échanges HTTP sont enregistrés dans cassettes/ ; ensuite
+    ils sont rejoués depuis le disque. Les credentials et le token ne sont jamais enregistrés.
+    """
+    return {
+        "cassette_library_dir": "cassettes",
+        "record_mode": "once",
+        "filter_headers": ["authorization"],
+        "filter_post_data_parameters": ["client_id", "client_secret"],
+        "decode_compressed_response": True,
+        "before_record_response": _scrub_token,
+    }
+
+
+@pytest.fixture(scope="session")
+def judilibre_api(pytestconfig):
+    """Instance unique de JudilibreAPI (sandbox) partagée par toute la session de tests."""
+    return _prime_token(JudilibreAPI(sandbox=True), pytestconfig.getoption("vcr_record", None))
+
+
+@pytest.fixture(scope="session")
+def legifrance_api(pytestconfig):
+    """Instance unique de LegifranceAPI (sandbox) partagée par toute la session de tests."""
+    return _prime_token(LegifranceAPI(sandbox=True), pytestconfig.getoption("vcr_record", None))
+
+
+def _offline(api_class, api_path):
+    """
+    Crée un client sans appeler __init__ : ni lecture du .env, ni credentials, ni session HTTP.
+    Réservé aux tests de validation des paramètres, qui échouent avant tout appel réseau
+    (un appel réseau inattendu lèverait AttributeError faute de session).
+    """
+    api = api_class.__new__(api_class)
+    api.client_id = "offline-client-id"
+    api.client_secret = "offline-client-secret"
+    api.token_url = "https://sandbox-oauth.invalid/api/oauth/token"
+    api.base_url = "https://sandbox-api.invalid"
+    api.api_url = f"{api.base_url}{api_path}"
+    api.access_token = None
+    api.token_expires_at = None
+    api.token_cache_path = None
+    return api
+
+
+@pytest.fixture(scope="session")
+def offline_judilibre_api():
+    """JudilibreAPI hors ligne, pour les tests de validation des paramètres."""
+    return _offline(JudilibreAPI, "/cassation/judilibre/v1.0")
+
+
+@pytest.fixture(scope="session")
+def offline_legifrance_api():
+    """LegifranceAPI hors ligne, pour les tests de validation des paramètres."""
+    return _offline(LegifranceAPI, "/dila/legifrance/lf-engine-app")
@@ -11,24 +11,71 @@ Remarques :
    et d’outils d’intelligence artificielle.
 """
 
+import asyncio
+import atexit
+import copy
+import difflib
+import inspect
+import json
 import logging
+import os
+import re
+import sqlite3
 import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import product, zip_longest
 from typing import Any, Dict, List, Optional, Union
+from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from api_judilibre import JudilibreAPI
+from api_judilibre import JudilibreAPI, _DEFAULT_JURISDICTIONS
 from api_legifrance import LegifranceAPI
 
 # ============================================================================
 # CONFIGURATION ET INITIALISATION
 # ============================================================================
 
+# Charger le fichier .env avant la configuration du logging (LOG_LEVEL)
+load_dotenv(verbose=False)
+
+# Niveau de log configurable via LOG_LEVEL (DEBUG, INFO, WARNING, ERROR). Défaut : WARNING
+_log_level = logging.getLevelName(os.getenv("LOG_LEVEL", "WARNING").upper())
+
+class RingHandler(logging.Handler):
+    """
+    Handler de logging conservant en mémoire les derniers messages (tampon circulaire).
+
+    Les messages sont consultables à la demande via la ressource MCP logs://recent,
+    sans avoir accès au flux stderr du serveur. Le handler n'est installé qu'avec
+    DROIT_FRANCAIS_MCP_LOG_BUFFER=1 : sinon aucun message n'est formaté ni conservé en double.
+    """
+
+    def __init__(self, capacity: int = 5000):
+        super().__init__()
+        self.buffer = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+_ring_handler = RingHandler() if os.getenv("DROIT_FRANCAIS_MCP_LOG_BUFFER") else None
+
 # Configuration du logging pour debugging
 logging.basicConfig(
-    level=logging.WARNING,
+    level=_log_level if isinstance(_log_level, int) else logging.WARNING,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
         logging.StreamHandler(sys.stderr),  # Envoi vers stderr pour MCP
+        # Derniers messages consultables via logs://recent (optionnel)
+        *([_ring_handler] if _ring_handler else []),
     ],
 )
 logger = logging.getLogger(__name__)
@@ -37,23 +84,127 @@ logger = logging.getLogger(__name__)
 try:
     mcp = FastMCP(f"FR Légifrance et Judilibre MCP Server - Droit Français Officiel")
 except Exception as e:
-    logger.error(f"Échec de l'initialisation du serveur MCP: {e}")
+    logger.error("Échec de l'initialisation du serveur MCP: %s", e)
     raise
 
 # Initialisation de l'API LegiFrance
 try:
     legifranceapi = LegifranceAPI(sandbox=False)
 except Exception as e:
-    logger.error(f"Erreur lors de l'initialisation de l'API LegiFrance: {e}")
+    logger.error("Erreur lors de l'initialisation de l'API LegiFrance: %s", e)
     legifranceapi = None
 
 # Initialisation de l'API Judilibre
+# Les caches mémoire du client sont désactivés : le serveur a ses propres caches
+# (taxonomies avec TTL d'une heure, décisions en mémoire et sur disque)
 try:
-    judilibreapi = JudilibreAPI(sandbox=False)
+    judilibreapi = JudilibreAPI(sandbox=False, cache_ttl=0)
 except Exception as e:
-    logger.error(f"Erreur lors de l'initialisation de l'API Judilibre: {e}")
+    logger.error("Erreur lors de l'initialisation de l'API Judilibre: %s", e)
     judilibreapi = None
 
+# Fermeture des sessions HTTP (pools de connexions) à l'arrêt du serveur
+for _api in (legifranceapi, judilibreapi):
+    if _api is not None:
+        atexit.register(_api.session.close)
+
+# Réponses d'erreur fréquentes, partagées entre les appels (ne pas les modifier)
+_ERR_LEGIFRANCE_NON_INIT = {"erreur": "L'API Légifrance n'est pas initialisée"}
+_ERR_JUDILIBRE_NON_INIT = {"erreur": "L'API Judilibre n'est pas initialisée"}
+_ERR_ID_ARTICLE_VIDE = {"erreur": "L'ID de l'article ne peut pas être vide"}
+_ERR_ID_DECISION_VIDE = {"erreur": "L'ID de la décision ne peut pas être vide"}
+
+# Format des identifiants Légifrance acceptés par consulter_legifrance : préfixe de 8 lettres
+# (base + type : LEGIARTI, JORFTEXT, JORFDOLE, KALICONT, CNILTEXT...) suivi du numéro,
+# éventuellement daté (ex: LEGIARTI000006419292, LEGITEXT000006069565_31-12-2006)
+_ARTICLE_ID_RE = re.compile(r"^[A-Z]{8}\d{6,16}(?:_[\d-]+)?$")
+# Format des identifiants de décisions Judilibre : alphanumériques (aujourd'hui 24 caractères
+# hexadécimaux, ex: 5fca7e0d4b6b4a1e8c0b0d1a). La longueur n'est pas figée ; un numéro de pourvoi
+# ou un ECLI est rejeté avant tout appel à l'API.
+_DECISION_ID_RE = re.compile(r"^[0-9A-Za-z]{16,64}$")
+
+
+def _invalid_decision_id(decision_id: str) -> Dict[str, str]:
+    """Réponse d'erreur pour un identifiant de décision Judilibre mal formé."""
+    return {"erreur": f"Format d'ID invalide: '{decision_id}' (attendu: identifiant alphanumérique, ex: 5fca7e0d4b6b4a1e8c0b0d1a)"}
+
+
+class _TTLCache:
+    """
+    Cache mémoire LRU borné avec expiration (TTL), utilisable depuis plusieurs threads.
+
+    Les valeurs sont retournées sans copie : l'appelant ne doit pas les modifier.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Retourne la valeur associée à key, ou None si absente ou expirée."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Enregistre value ; l'entrée la moins récemment utilisée est évincée si le cache est plein."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._data.clear()
+
+
+def _select(item: Any, champs: Optional[List[str]]) -> Any:
+    """
+    Ne conserve dans un dict que les champs demandés (les champs absents sont ignorés).
+    L'élément est retourné inchangé si champs est vide ou s'il ne s'agit pas d'un dict.
+    """
+    if not champs or not isinstance(item, dict):
+        return item
+    return {k: item[k] for k in champs if k in item}
+
+
+def _project(items: List[Dict[str, Any]], champs: List[str]) -> List[Dict[str, Any]]:
+    """Applique _select() à chaque élément d'une liste de résultats."""
+    return [_select(item, champs) for item in items]
+
+
+def run_in_thread(fn):
+    """
+    Décorateur rendant un outil synchrone asynchrone : l'appel est exécuté dans un thread
+    (asyncio.to_thread) afin de ne pas bloquer la boucle d'événements du serveur MCP pendant
+    les requêtes HTTP vers les API. La signature et la docstring de l'outil sont conservées.
+
+    Usage:
+        @mcp.tool
+        @run_in_thread
+        def rechercher_legifrance(...): ...
+    """
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return wrapper
+
+
+# Caches mémoire des consultations (1 heure) : un même texte est souvent redemandé dans une session
+_legifrance_consult_cache = _TTLCache(maxsize=4096, ttl=3600)
+_decision_memory_cache = _TTLCache(maxsize=1024, ttl=3600)
+
 
 # ============================================================================
 # RESOURCES - DOCUMENTATION DÉTAILLÉE
@@ -196,13 +347,164 @@ def documentation_options_tri_judilibre() -> str:
 """
 
 
+@mcp.resource("logs://recent")
+def logs_recents() -> str:
+    """Derniers messages de log du serveur (tampon activé par DROIT_FRANCAIS_MCP_LOG_BUFFER=1)."""
+    if _ring_handler is None:
+        return "Tampon de logs désactivé : définir DROIT_FRANCAIS_MCP_LOG_BUFFER=1 pour l'activer."
+    return "\n".join(list(_ring_handler.buffer))
+
+
 
 # ============================================================================
 # OUTILS LEGIFRANCE - RECHERCHE DES TEXTES DE DROIT FRANÇAIS
 # ============================================================================
 
+# Fonds Légifrance acceptant les filtres de dates (date_debut/date_fin)
+_FONDS_WITH_DATE_FILTERS_ORDER = (
+    "JORF", "LODA_DATE", "LODA_ETAT", "JURI", "CETAT", "JUFI", "CONSTIT", "KALI", "CIRC", "ACCO"
+)
+_FONDS_WITH_DATE_FILTERS = frozenset(_FONDS_WITH_DATE_FILTERS_ORDER)
+_FONDS_WITH_DATE_FILTERS_STR = ", ".join(_FONDS_WITH_DATE_FILTERS_ORDER)
+
+# Taille de page maximale acceptée par les API Légifrance et Judilibre
+_MAX_PAGE_SIZE = 50
+
+
+def _clamp_page_size(size: int) -> int:
+    """Ramène une taille de page dans l'intervalle [1, _MAX_PAGE_SIZE]."""
+    return max(1, min(size, _MAX_PAGE_SIZE))
+
+
+# Cache court (60 s) des recherches sans résultat ou rejetées par l'API (erreur HTTP 4xx) :
+# les requêtes mal formées (fautes de frappe, combinaisons non supportées) sont souvent
+# relancées telles quelles. Les résultats non vides et les erreurs transitoires (réseau,
+# délai dépassé, 408, 429, 5xx) ne sont pas mis en cache.
+_legifrance_negative_cache = _TTLCache(maxsize=1024, ttl=60)
+
+
+class _FailedSearch:
+    """Recherche rejetée par l'API, conservée dans le cache négatif avec son message d'erreur."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def _is_client_error(exc: Optional[BaseException]) -> bool:
+    """
+    Indique si l'exception provient d'une réponse HTTP 4xx déterministe (hors 408 et 429).
+    La chaîne des exceptions est parcourue : le client Légifrance encapsule l'erreur requests.
+    """
+    while exc is not None:
+        response = getattr(exc, "response", None)
+        if response is not None:
+            return 400 <= response.status_code < 500 and response.status_code not in (408, 429)
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _is_empty_search(search_results: Any) -> bool:
+    """Indique si une réponse de legifranceapi.search() ne contient aucun résultat."""
+    if isinstance(search_results, dict):
+        return not search_results.get("results")
+    # None, liste vide ou message "Aucun résultat"
+    return not search_results or isinstance(search_results, str)
+
+
+def _legifrance_search_error(message: str) -> Dict[str, Any]:
+    """Réponse d'erreur des recherches Légifrance, dans la forme {"results", "warnings"} des résultats."""
+    return {"results": [], "warnings": [message], "erreur": message}
+
+
+def _rechercher_legifrance(
+    recherche: str,
+    fond: str = "ALL",
+    type_champ: str = "ALL",
+    type_recherche: str = "TOUS_LES_MOTS_DANS_UN_CHAMP",
+    code: Optional[str] = None,
+    date_debut: Optional[str] = None,
+    date_fin: Optional[str] = None,
+    page: int = 0,
+    page_taille: int = 20,
+    tri: Optional[str] = "PERTINENCE",
+    operateur: str = "ET",
+    champs: Optional[List[str]] = None,
+) -> Any:
+    """
+    Recherche Légifrance partagée par rechercher_legifrance et rechercher_legifrance_batch.
+
+    Mêmes paramètres et même résultat que l'outil ; les erreurs de l'API sont propagées.
+    """
+    # Validation des paramètres
+    if not recherche or recherche.isspace():
+        logger.error("Requête de recherche vide")
+        return {"results": [], "warnings": None}
+
+    # Vérification de l'initialisation de l'API
+    if legifranceapi is None:
+        logger.error("API Légifrance non initialisée")
+        return _legifrance_search_error(_ERR_LEGIFRANCE_NON_INIT["erreur"])
+
+    page_taille = _clamp_page_size(page_taille)
+
+    # Validation des filtres de dates selon le fond
+    if (date_debut or date_fin) and fond not in _FONDS_WITH_DATE_FILTERS:
+        warning = [
+            f"⚠️ ATTENTION: Les filtres de dates (date_debut/date_fin) sont ignorés pour le fond '{fond}'. "
+            f"Les filtres de dates ne fonctionnent que pour les fonds: {_FONDS_WITH_DATE_FILTERS_STR}"
+        ]
+        # Effacer les filtres de dates pour éviter toute confusion
+        date_debut = None
+        date_fin = None
+    else:
+        warning = None
+
+    signature = (
+        recherche, fond, type_champ, type_recherche, code,
+        date_debut, date_fin, page, page_taille, tri, operateur,
+    )
+    search_results = _legifrance_negative_cache.get(signature)
+    if isinstance(search_results, _FailedSearch):
+        raise Exception(search_results.message)
+    if search_results is None:
+        try:
+            search_results = legifranceapi.search(
+                query=recherche,
+                fond=fond,
+                field_type=type_champ,
+                search_type=type_recherche,
+                code=code,
+                date_start=date_debut,
+                date_end=date_fin,
+                page_number=page,
+                page_size=page_taille,
+                sort=tri,
+                operator=operateur,
+            )
+        except Exception as e:
+            if _is_client_error(e):
+                _legifrance_negative_cache.set(signature, _FailedSearch(str(e)))
+            raise
+        if _is_empty_search(search_results):
+            _legifrance_negative_cache.set(signature, search_results if search_results is not None else [])
+
+    if isinstance(search_results, dict):
+        # Les autres clés de premier niveau (nombre total de résultats, pagination...) sont conservées
+        output = {k: v for k, v in search_results.items() if k != "results"}
+        hits = search_results.get("results") or []
+    else:
+        output, hits = {}, []
+    if champs and hits:
+        hits = _project(hits, champs)
+
+    output.update(results=hits, warnings=warning)
+    return output
+
 
 @mcp.tool
+@run_in_thread
 def rechercher_legifrance(
     recherche: str,
     fond: str = "ALL",
@@ -215,6 +517,7 @@ def rechercher_legifrance(
     page_taille: int = 20,
     tri: Optional[str] = "PERTINENCE",
     operateur: str = "ET",
+    champs: Optional[List[str]] = None,
 ) -> Any:
     """
     Recherche avancée dans la base juridique Légifrance (codes, lois, jurisprudence, conventions).
@@ -231,9 +534,15 @@ def rechercher_legifrance(
         page_taille: Résultats par page (max 50). Défaut: 20
         tri: Ordre de tri avec PERTINENCE, SIGNATURE_DATE_DESC, SIGNATURE_DATE_ASC, DATE_PUBLI_DESC, DATE_PUBLI_ASC Défaut: PERTINENCE
         operateur: Opérateur entre champs (ET, OU). Défaut: "ET"
+        champs: Champs à conserver pour chaque résultat (ex: ["titles", "nature", "datePublication"]).
+            Défaut : None (tous les champs)
 
     Returns:
-        Liste de résultats avec métadonnées. Utiliser l'outil consult_legifrance(id) pour le contenu complet.
+        {"results": [...], "warnings": [...] ou None}, plus les autres clés de premier niveau
+        de la réponse de l'API (nombre total de résultats, pagination...) lorsqu'elles sont présentes.
+        Les résultats contiennent les métadonnées ; utiliser l'outil consulter_legifrance(id) pour
+        le contenu complet. "warnings" signale notamment les filtres de dates ignorés pour le fond demandé.
+        En cas d'échec, {"results": [], "warnings": [message], "erreur": message}.
 
     Ressources utiles:
         - legifrance://documentation/fonds - Liste des fonds disponibles
@@ -242,59 +551,35 @@ def rechercher_legifrance(
         - legifrance://documentation/filtres-dates - Guide sur les filtres de dates
         - legifrance://documentation/options-tri - Valeurs pour sort
     """
+    logger.debug(
+        "APPEL: rechercher_legifrance(recherche=%r, fond=%r, type_champ=%r, code=%r, page=%r, page_taille=%r, champs=%r)",
+        recherche, fond, type_champ, code, page, page_taille, champs,
+    )
 
     try:
-        # Validation des paramètres
-        if not recherche or not recherche.strip():
-            logger.error("Requête de recherche vide")
-            return []
-
-        # Vérification de l'initialisation de l'API
-        if legifranceapi is None:
-            logger.error("API Légifrance non initialisée")
-            return []
-
-        # Validation des filtres de dates selon le fond
-        FONDS_WITH_DATE_FILTERS = ["JORF", "LODA_DATE", "LODA_ETAT", "JURI", "CETAT", "JUFI", "CONSTIT", "KALI", "CIRC", "ACCO"]
-
-        if (date_debut or date_fin) and fond not in FONDS_WITH_DATE_FILTERS:
-            warning = [
-                f"⚠️ ATTENTION: Les filtres de dates (date_debut/date_fin) sont ignorés pour le fond '{fond}'. "
-                f"Les filtres de dates ne fonctionnent que pour les fonds: {', '.join(FONDS_WITH_DATE_FILTERS)}"
-            ]
-            # Effacer les filtres de dates pour éviter toute confusion
-            date_debut = None
-            date_fin = None
-        else:
-            warning = None
-
-        search_results = legifranceapi.search(
-            query=recherche,
+        return _rechercher_legifrance(
+            recherche,
             fond=fond,
-            field_type=type_champ,
-            search_type=type_recherche,
+            type_champ=type_champ,
+            type_recherche=type_recherche,
             code=code,
-            date_start=date_debut,
-            date_end=date_fin,
-            page_number=page,
-            page_size=page_taille,
-            sort=tri,
-            operator=operateur,
+            date_debut=date_debut,
+            date_fin=date_fin,
+            page=page,
+            page_taille=page_taille,
+            tri=tri,
+            operateur=operateur,
+            champs=champs,
         )
 
-        search_results = search_results or []
-        if warning:
-            search_results = {"warning": warning, "results": search_results}
-
-        return search_results
-
     except Exception as e:
-        logger.error(f"Erreur lors de la recherche '{recherche}': {e}")
-        return "Erreur lors de la recherche"
+        logger.error("Erreur lors de la recherche '%s': %s", recherche, e)
+        return _legifrance_search_error("Erreur lors de la recherche")
 
 
 @mcp.tool
-def consulter_legifrance(id: str) -> Any:
+@run_in_thread
+def consulter_legifrance(id: str, champs: Optional[List[str]] = None) -> Any:
     """
     Récupère le texte intégral d'un article juridique depuis Légifrance.
 
@@ -303,36 +588,259 @@ def consulter_legifrance(id: str) -> Any:
     Args:
         id: ID de l'article (LEGIARTI..., LEGITEXT..., JURITEXT..., etc.)
                    Obtenu depuis les résultats de recherche (metadata 'id')
+        champs: Champs de premier niveau à conserver dans la réponse (ex: ["article"] pour
+            un LEGIARTI, ["text"] pour un JURITEXT). Défaut : None (réponse complète)
 
     Returns:
         Le contenu juridique 
     """
+    logger.debug("APPEL: consulter_legifrance(id=%r, champs=%r)", id, champs)
 
     try:
-        # Validation des paramètres
-        if not id or not id.strip():
-            logger.error("ID article vide")
-            return {"erreur": "L'ID de l'article ne peut pas être vide"}
+        article = _consulter_legifrance(id)
+        if isinstance(article, dict) and "erreur" in article:
+            return article
+        return _select(article, champs)
+
+    except Exception as e:
+        logger.error("Erreur lors de la récupération de l'article '%s': %s", id, e)
+        return {"erreur": f"Erreur de récupération d'article: {str(e)}"}
 
-        # Vérification de l'initialisation de l'API
-        if legifranceapi is None:
-            logger.error("API Légifrance non initialisée")
-            return {"erreur": "L'API Légifrance n'est pas initialisée"}
 
+def _consulter_legifrance(id: str) -> Any:
+    """
+    Consultation Légifrance partagée par consulter_legifrance et rechercher_et_consulter_legifrance.
+
+    Valide l'identifiant puis interroge le cache mémoire avant l'API.
+    Retourne un dict {"erreur": ...} si l'identifiant est invalide ; les erreurs de l'API sont propagées.
+    """
+    # Validation des paramètres
+    if not id or id.isspace():
+        logger.error("ID article vide")
+        return _ERR_ID_ARTICLE_VIDE
+
+    id = id.strip()
+    if not _ARTICLE_ID_RE.match(id):
+        logger.error("Format d'ID article invalide: '%s'", id)
+        return {"erreur": f"Format d'ID invalide: '{id}' (attendu: LEGIARTI..., LEGITEXT..., JURITEXT..., etc.)"}
+
+    # Vérification de l'initialisation de l'API
+    if legifranceapi is None:
+        logger.error("API Légifrance non initialisée")
+        return _ERR_LEGIFRANCE_NON_INIT
+
+    article = _legifrance_consult_cache.get(id)
+    if article is None:
         article = legifranceapi.consult(id)
-        return article
+        if article:
+            _legifrance_consult_cache.set(id, article)
+    return article
 
+
+def _consulter_legifrance_safe(id: Optional[str]) -> Any:
+    """Comme _consulter_legifrance, mais retourne un dict {"erreur": ...} au lieu de lever une exception."""
+    if not id:
+        return {"erreur": "Identifiant absent du résultat de recherche"}
+    try:
+        return _consulter_legifrance(id)
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération de l'article '{id}'")
+        logger.error("Erreur lors de la récupération de l'article '%s': %s", id, e)
         return {"erreur": f"Erreur de récupération d'article: {str(e)}"}
 
 
+def _hit_id(hit: Any) -> Optional[str]:
+    """Identifiant d'un résultat de recherche Légifrance (titles[0].id, à défaut id)."""
+    if not isinstance(hit, dict):
+        return None
+    titles = hit.get("titles")
+    if isinstance(titles, list) and titles and isinstance(titles[0], dict) and titles[0].get("id"):
+        return titles[0]["id"]
+    return hit.get("id")
+
+
+@mcp.tool
+async def rechercher_et_consulter_legifrance(
+    recherche: str,
+    top_k: int = 5,
+    fond: str = "ALL",
+    type_champ: str = "ALL",
+    type_recherche: str = "TOUS_LES_MOTS_DANS_UN_CHAMP",
+    code: Optional[str] = None,
+    date_debut: Optional[str] = None,
+    date_fin: Optional[str] = None,
+    tri: Optional[str] = "PERTINENCE",
+    operateur: str = "ET",
+) -> Any:
+    """
+    Recherche dans Légifrance puis récupère en parallèle le contenu complet des premiers résultats.
+
+    Remplace un appel à rechercher_legifrance suivi de plusieurs appels à consulter_legifrance.
+
+    Args:
+        recherche: Terme(s) de recherche. Ex: "mariage", "responsabilité civile"
+        top_k: Nombre de résultats à consulter (max 50). Défaut: 5
+        fond, type_champ, type_recherche, code, date_debut, date_fin, tri, operateur:
+            Mêmes paramètres que rechercher_legifrance
+
+    Returns:
+        {"results": [résultat de recherche + "contenu"], "warnings": [...] ou None} et les autres
+        clés de premier niveau, comme rechercher_legifrance (y compris en cas d'échec de la
+        recherche). En cas d'échec de consultation, "contenu" vaut {"erreur": "..."}.
+    """
+    logger.debug(
+        "APPEL: rechercher_et_consulter_legifrance(recherche=%r, top_k=%r, fond=%r, code=%r)",
+        recherche, top_k, fond, code,
+    )
+
+    if legifranceapi is None:
+        logger.error("API Légifrance non initialisée")
+        return _legifrance_search_error(_ERR_LEGIFRANCE_NON_INIT["erreur"])
+
+    top_k = _clamp_page_size(top_k)
+    try:
+        search_results = await asyncio.to_thread(
+            _rechercher_legifrance,
+            recherche,
+            fond=fond,
+            type_champ=type_champ,
+            type_recherche=type_recherche,
+            code=code,
+            date_debut=date_debut,
+            date_fin=date_fin,
+            page=0,
+            page_taille=top_k,
+            tri=tri,
+            operateur=operateur,
+        )
+    except Exception as e:
+        logger.error("Erreur lors de la recherche '%s': %s", recherche, e)
+        return _legifrance_search_error("Erreur lors de la recherche")
+
+    hits = search_results["results"][:top_k]
+
+    contenus = await asyncio.gather(
+        *(asyncio.to_thread(_consulter_legifrance_safe, _hit_id(hit)) for hit in hits)
+    )
+
+    return {
+        **search_results,
+        "results": [{**hit, "contenu": contenu} for hit, contenu in zip(hits, contenus)],
+    }
+
+
 # ============================================================================
 # OUTILS JUDILIBRE - RECHERCHE DE JURISPRUDENCE
 # ============================================================================
 
 
+def require_judilibre(erreur: Any, non_init: Any = _ERR_JUDILIBRE_NON_INIT):
+    """
+    Décorateur des outils Judilibre : vérifie que l'API est initialisée et intercepte les exceptions.
+
+    À placer sous @mcp.tool. La signature de l'outil est conservée (functools.wraps).
+
+    Args:
+        erreur: Valeur retournée à l'appelant lorsque l'outil lève une exception
+        non_init: Valeur retournée lorsque l'API n'est pas initialisée, dans la forme des
+            autres erreurs de l'outil. Défaut : {"erreur": "L'API Judilibre n'est pas initialisée"}
+
+    Examples:
+        @mcp.tool
+        @require_judilibre({"erreur": "Erreur taxonomie"})
+        def obtenir_taxonomie_judilibre(...): ...
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if judilibreapi is None:
+                logger.error("API Judilibre non initialisée")
+                return copy.deepcopy(non_init)
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Erreur dans l'outil %s: %s", fn.__name__, e)
+                return copy.deepcopy(erreur)
+        return wrapper
+    return decorator
+
+# Durée de validité (en secondes) du cache des taxonomies Judilibre
+_TAXONOMY_TTL = 3600
+
+
+@lru_cache(maxsize=256)
+def _taxonomy_cached(
+    taxonomy_id: Optional[str],
+    key: Optional[str],
+    value: Optional[str],
+    context_value: Optional[str],
+    epoch: int,
+) -> Any:
+    """
+    Appel mémorisé à judilibreapi.taxonomy().
+
+    Le paramètre epoch (tranche de _TAXONOMY_TTL secondes) fait partie de la clé du cache :
+    lorsqu'il change, les entrées précédentes ne sont plus atteintes et l'API est rappelée.
+    Les exceptions ne sont pas mémorisées.
+    """
+    return judilibreapi.taxonomy(
+        taxonomy_id=taxonomy_id, key=key, value=value, context_value=context_value
+    )
+
+
+def _taxonomy(
+    taxonomy_id: Optional[str] = None,
+    key: Optional[str] = None,
+    value: Optional[str] = None,
+    context_value: Optional[str] = None,
+) -> Any:
+    """
+    Retourne une taxonomie Judilibre depuis le cache (TTL d'une heure).
+
+    Le résultat est une copie profonde : l'appelant peut le modifier sans altérer le cache.
+    """
+    epoch = int(time.monotonic() // _TAXONOMY_TTL)
+    return copy.deepcopy(_taxonomy_cached(taxonomy_id, key, value, context_value, epoch))
+
+
+def _taxonomy_lookup(
+    taxonomy_id: str,
+    key: Optional[str] = None,
+    value: Optional[str] = None,
+    context_value: Optional[str] = None,
+) -> Optional[Dict[str, str]]:
+    """
+    Résout clé → intitulé ou intitulé → clé depuis la liste complète de la taxonomie mise en cache.
+
+    Args:
+        taxonomy_id: Type de taxonomie (jurisdiction, chamber, solution, etc.)
+        key: Clé dont on cherche l'intitulé
+        value: Intitulé dont on cherche la clé (comparaison insensible à la casse)
+        context_value: Contexte éventuel de la taxonomie (cc, ca, tj)
+
+    Returns:
+        {"value": intitulé} ou {"key": clé}, ou None si l'entrée est introuvable dans le cache
+        (l'appelant interroge alors l'API directement).
+    """
+    epoch = int(time.monotonic() // _TAXONOMY_TTL)
+    entries = _taxonomy_cached(taxonomy_id, None, None, context_value, epoch)
+    if not isinstance(entries, dict):
+        return None
+
+    if key is not None:
+        if key in entries:
+            return {"value": entries[key]}
+        return None
+
+    wanted = value.casefold()
+    for entry_key, entry_value in entries.items():
+        if isinstance(entry_value, str) and entry_value.casefold() == wanted:
+            return {"key": entry_key}
+    return None
+
+
 @mcp.tool
+@run_in_thread
+@require_judilibre({"erreur": "Erreur taxonomie"})
 def obtenir_taxonomie_judilibre(
     taxonomy_id: Optional[str] = None,
     key: Optional[str] = None,
@@ -363,26 +871,210 @@ def obtenir_taxonomie_judilibre(
         - judilibre://documentation/solutions - Types de solutions
     """
     logger.debug(
-        f"APPEL: obtenir_taxonomie_judilibre(taxonomy_id='{taxonomy_id}', key='{key}', value='{value}', context_value='{context_value}')"
+        "APPEL: obtenir_taxonomie_judilibre(taxonomy_id=%r, key=%r, value=%r, context_value=%r)",
+        taxonomy_id, key, value, context_value,
     )
 
-    try:
-        if judilibreapi is None:
-            logger.error("API Judilibre non initialisée")
-            return {"erreur": "L'API Judilibre n'est pas initialisée"}
-
-        result = judilibreapi.taxonomy(
-            taxonomy_id=taxonomy_id, key=key, value=value, context_value=context_value
+    # Recherche clé → intitulé ou intitulé → clé : tenter d'abord la liste complète en cache
+    if taxonomy_id and bool(key) != bool(value):
+        result = _taxonomy_lookup(
+            taxonomy_id, key=key, value=value, context_value=context_value
         )
+        if result is not None:
+            return result
 
-        return result
+    result = _taxonomy(
+        taxonomy_id=taxonomy_id, key=key, value=value, context_value=context_value
+    )
 
-    except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la taxonomie: {e}")
-        return {"erreur": f"Erreur taxonomie"}
+    return result
+
+
+def _wrap(value: Optional[str]) -> Optional[tuple]:
+    """Convertit un filtre unique en tuple à un élément (None si vide) pour judilibreapi.search()."""
+    return (value,) if value else None
+
+
+# Valeurs acceptées par les filtres de recherche Judilibre
+# (par défaut toutes les juridictions : _DEFAULT_JURISDICTIONS, partagé avec api_judilibre)
+_JURIDICTIONS = frozenset(_DEFAULT_JURISDICTIONS)
+_CHAMBRES_CC = frozenset({
+    "pl", "mi", "civ1", "civ2", "civ3", "comm", "soc", "cr", "creun", "ordo", "allciv", "other"
+})
+# Intitulés usuels des chambres de la Cour de cassation → clé attendue par l'API
+_CHAMBRE_LABELS = {
+    "assemblée plénière": "pl",
+    "chambre mixte": "mi",
+    "première chambre civile": "civ1",
+    "1ère chambre civile": "civ1",
+    "1re chambre civile": "civ1",
+    "deuxième chambre civile": "civ2",
+    "2e chambre civile": "civ2",
+    "troisième chambre civile": "civ3",
+    "3e chambre civile": "civ3",
+    "chambre commerciale": "comm",
+    "chambre sociale": "soc",
+    "chambre criminelle": "cr",
+    "chambres réunies": "creun",
+    "ordonnance": "ordo",
+    "toutes les chambres civiles": "allciv",
+    "autre": "other",
+}
+_TRIS = frozenset({"scorepub", "score", "date"})
+_ORDRES = frozenset({"asc", "desc"})
+# Zones de contenu des décisions (paramètre zones de consulter_decision_judilibre)
+_ZONES = frozenset({"introduction", "expose", "moyens", "motivations", "dispositif", "annexes"})
+
+
+# Ordinaux des chambres civiles ramenés à un chiffre ("1re", "1ère", "première" -> "1")
+_ORDINALS_RE = (
+    (re.compile(r"\b(?:premiere|1ere|1re|1er)\b"), "1"),
+    (re.compile(r"\b(?:deuxieme|seconde|2eme|2e)\b"), "2"),
+    (re.compile(r"\b(?:troisieme|3eme|3e)\b"), "3"),
+)
+
+
+def _normalize_label(label: str) -> str:
+    """Normalise un intitulé : casse, accents, espaces et ordinaux ("1ère" -> "1")."""
+    label = unicodedata.normalize("NFKD", label.casefold())
+    label = "".join(c for c in label if not unicodedata.combining(c))
+    label = " ".join(label.split())
+    for pattern, digit in _ORDINALS_RE:
+        label = pattern.sub(digit, label)
+    return label
+
+
+_CHAMBRE_LABELS_NORMALIZED = {_normalize_label(k): v for k, v in _CHAMBRE_LABELS.items()}
+
+
+def _correct_chambre(chambre: Optional[str]) -> Optional[str]:
+    """
+    Convertit un intitulé de chambre (ex: "Première chambre civile") en sa clé ("civ1").
+
+    Seules les correspondances exactes après normalisation (casse, accents, "1re"/"première")
+    sont acceptées. La valeur est retournée inchangée si c'est déjà une clé connue ou si
+    aucun intitulé n'en est proche.
+
+    Raises:
+        ValueError: Si l'intitulé ne correspond exactement à aucune chambre mais est proche
+            d'un ou plusieurs intitulés connus (ex: "chambre civile") ; le message liste
+            les chambres candidates au lieu d'en choisir une.
+    """
+    if not chambre or chambre in _CHAMBRES_CC:
+        return chambre
+    normalized = _normalize_label(chambre)
+    if normalized in _CHAMBRE_LABELS_NORMALIZED:
+        return _CHAMBRE_LABELS_NORMALIZED[normalized]
+
+    close = difflib.get_close_matches(
+        normalized, _CHAMBRE_LABELS_NORMALIZED, n=len(_CHAMBRE_LABELS_NORMALIZED), cutoff=0.85
+    )
+    if not close:
+        return chambre
+    candidates = sorted({_CHAMBRE_LABELS_NORMALIZED[label] for label in close})
+    raise ValueError(
+        f"chambre ambiguë ou inconnue: '{chambre}'. Chambres proches: {', '.join(candidates)}"
+    )
+
+
+def _check_judilibre_filters(
+    juridictions: Optional[List[str]] = None,
+    chambres: Optional[List[str]] = None,
+    tri: Optional[str] = None,
+    ordre: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Vérifie localement les filtres de recherche Judilibre avant l'appel à l'API.
+
+    Les chambres ne sont vérifiées que pour une recherche limitée à la Cour de cassation
+    (les codes de chambre des autres juridictions ne sont pas énumérés).
+
+    Returns:
+        Message d'erreur décrivant la première valeur invalide, ou None si tout est valide
+    """
+    for juridiction in juridictions or ():
+        if juridiction not in _JURIDICTIONS:
+            return f"juridiction invalide: '{juridiction}'. Valeurs: {', '.join(sorted(_JURIDICTIONS))}"
+    if juridictions and set(juridictions) == {"cc"}:
+        for chambre in chambres or ():
+            if chambre not in _CHAMBRES_CC:
+                return f"chambre invalide: '{chambre}'. Valeurs: {', '.join(sorted(_CHAMBRES_CC))}"
+    if tri is not None and tri not in _TRIS:
+        return f"tri invalide: '{tri}'. Valeurs: {', '.join(sorted(_TRIS))}"
+    if ordre is not None and ordre not in _ORDRES:
+        return f"ordre invalide: '{ordre}'. Valeurs: {', '.join(sorted(_ORDRES))}"
+    return None
+
+
+def _rechercher_jurisprudence_judilibre(
+    recherche: Optional[str] = None,
+    juridiction: Optional[str] = None,
+    localisation: Optional[str] = None,
+    chambre: Optional[str] = None,
+    type_decision: Optional[str] = None,
+    theme: Optional[str] = None,
+    solution: Optional[str] = None,
+    date_debut: Optional[str] = None,
+    date_fin: Optional[str] = None,
+    tri: str = "scorepub",
+    ordre: str = "desc",
+    nombre_resultats: int = 20,
+    page: int = 0,
+    champs: Optional[List[str]] = None,
+) -> Any:
+    """
+    Recherche Judilibre partagée par rechercher_jurisprudence_judilibre et
+    rechercher_jurisprudence_judilibre_batch.
+
+    Mêmes paramètres et même résultat que l'outil ; les erreurs de l'API sont propagées.
+    """
+    nombre_resultats = _clamp_page_size(nombre_resultats)
+    try:
+        chambre = _correct_chambre(chambre)
+    except ValueError as e:
+        logger.error("Paramètre de recherche Judilibre invalide: %s", e)
+        return [{"erreur": str(e)}]
+    erreur = _check_judilibre_filters(
+        _wrap(juridiction), _wrap(chambre), tri=tri, ordre=ordre
+    )
+    if erreur:
+        logger.error("Paramètre de recherche Judilibre invalide: %s", erreur)
+        return [{"erreur": erreur}]
+
+    # Conversion des paramètres en tuples si fournis
+    jurisdiction_list = _wrap(juridiction) or _DEFAULT_JURISDICTIONS
+    location_list = _wrap(localisation)
+    chamber_list = _wrap(chambre)
+    type_list = _wrap(type_decision)
+    theme_list = _wrap(theme)
+    solution_list = _wrap(solution)
+
+    results = judilibreapi.search(
+        query=recherche,
+        jurisdiction=jurisdiction_list,
+        location=location_list,
+        chamber=chamber_list,
+        type=type_list,
+        theme=theme_list,
+        solution=solution_list,
+        date_start=date_debut,
+        date_end=date_fin,
+        sort=tri,
+        order=ordre,
+        page_size=nombre_resultats,
+        page=page,
+        resolve_references=True,  # Obtenir les intitulés complets
+    )
+
+    if champs and results and results.get("results"):
+        results["results"] = _project(results["results"], champs)
+
+    return results
 
 
 @mcp.tool
+@run_in_thread
+@require_judilibre("Erreur lors de la recherche Judilibre", non_init=[_ERR_JUDILIBRE_NON_INIT])
 def rechercher_jurisprudence_judilibre(
     recherche: Optional[str] = None,
     juridiction: Optional[str] = None,
@@ -397,6 +1089,7 @@ def rechercher_jurisprudence_judilibre(
     ordre: str = "desc",
     nombre_resultats: int = 20,
     page: int = 0,
+    champs: Optional[List[str]] = None,
 ) -> Any:
     """
     Recherche de jurisprudence dans la base Judilibre (décisions de toutes les juridictions françaises).
@@ -420,6 +1113,8 @@ def rechercher_jurisprudence_judilibre(
         ordre: Sens du tri (desc, asc). Défaut: "desc"
         nombre_resultats: Résultats par page (max 50). Défaut: 20
         page: Numéro de page (commence à 0). Défaut : 0
+        champs: Champs à conserver pour chaque décision (ex: ["id", "decision_date", "chamber", "solution"]).
+            Défaut : None (tous les champs)
 
     Returns:
         Liste de décisions incluant les id.
@@ -434,75 +1129,473 @@ def rechercher_jurisprudence_judilibre(
         - judilibre://documentation/solutions - Types de solutions
         - judilibre://documentation/options-tri - Options de tri (tri + ordre)
    """
+    logger.debug(
+        "APPEL: rechercher_jurisprudence_judilibre(recherche=%r, juridiction=%r, chambre=%r, page=%r)",
+        recherche, juridiction, chambre, page,
+    )
+
+    return _rechercher_jurisprudence_judilibre(
+        recherche=recherche,
+        juridiction=juridiction,
+        localisation=localisation,
+        chambre=chambre,
+        type_decision=type_decision,
+        theme=theme,
+        solution=solution,
+        date_debut=date_debut,
+        date_fin=date_fin,
+        tri=tri,
+        ordre=ordre,
+        nombre_resultats=nombre_resultats,
+        page=page,
+        champs=champs,
+    )
 
+
+# Cache disque des décisions Judilibre (une décision publiée ne change plus)
+_DECISION_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "droit_francais_mcp", "decisions.sqlite3"
+)
+_DECISION_CACHE_TTL = 30 * 86400  # 30 jours
+
+
+class _DecisionCache:
+    """
+    Cache persistant (SQLite) des décisions Judilibre, indexé par identifiant de décision.
+
+    Les entrées expirent après _DECISION_CACHE_TTL secondes. Une erreur SQLite est
+    journalisée et traitée comme une absence d'entrée : le cache ne bloque jamais un appel.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS decisions "
+            "(id TEXT PRIMARY KEY, expires REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, decision_id: str) -> Any:
+        """Retourne la décision en cache, ou None si absente ou expirée."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expires, data FROM decisions WHERE id = ?", (decision_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Lecture du cache des décisions impossible: %s", e)
+            return None
+        if row is None or row[0] < time.time():
+            return None
+        return json.loads(row[1])
+
+    def set(self, decision_id: str, decision: Any) -> None:
+        """Enregistre une décision dans le cache."""
+        data = json.dumps(decision, ensure_ascii=False)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO decisions (id, expires, data) VALUES (?, ?, ?)",
+                    (decision_id, time.time() + _DECISION_CACHE_TTL, data),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Écriture dans le cache des décisions impossible: %s", e)
+
+
+def _open_decision_cache() -> Optional[_DecisionCache]:
+    """
+    Ouvre le cache des décisions, sauf si la variable d'environnement
+    DROIT_FRANCAIS_MCP_NO_CACHE est définie (utile pour le débogage).
+    """
+    if os.getenv("DROIT_FRANCAIS_MCP_NO_CACHE"):
+        return None
     try:
-        if judilibreapi is None:
-            logger.error("API Judilibre non initialisée")
-            return [{"erreur": "L'API Judilibre n'est pas initialisée"}]
-
-        # Conversion des paramètres en listes si fournis
-        jurisdiction_list = [juridiction] if juridiction else ["cc", "ca", "tj", "tcom"] # Par défaut toutes les juridictions
-        location_list = [localisation] if localisation else None
-        chamber_list = [chambre] if chambre else None
-        type_list = [type_decision] if type_decision else None
-        theme_list = [theme] if theme else None
-        solution_list = [solution] if solution else None
-
-        results = judilibreapi.search(
+        return _DecisionCache(_DECISION_CACHE_PATH)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Cache des décisions désactivé: %s", e)
+        return None
+
+
+# Le cache disque est ouvert à la première consultation (voir _get_decision_cache) :
+# importer le module ne crée ni répertoire ni fichier dans le dossier de l'utilisateur
+_NOT_OPENED = object()
+_decision_cache: Any = _NOT_OPENED
+_decision_cache_lock = threading.Lock()
+
+
+def _get_decision_cache() -> Optional[_DecisionCache]:
+    """Retourne le cache des décisions, ouvert au premier appel (None s'il est désactivé)."""
+    global _decision_cache
+    if _decision_cache is _NOT_OPENED:
+        with _decision_cache_lock:
+            if _decision_cache is _NOT_OPENED:
+                _decision_cache = _open_decision_cache()
+    return _decision_cache
+
+
+def _extract_zones(decision: Dict[str, Any], zones: List[str]) -> Dict[str, str]:
+    """
+    Extrait le texte des zones demandées à partir des positions start/end de decision["zones"].
+
+    Args:
+        decision: Décision brute (non nettoyée) contenant "text" et "zones"
+        zones: Noms des zones (introduction, expose, moyens, motivations, dispositif, annexes)
+
+    Returns:
+        Dict {zone: texte}, limité aux zones présentes dans la décision
+    """
+    text = decision.get("text") or ""
+    positions = decision.get("zones") or {}
+    return {
+        name: "\n".join(text[p["start"]:p["end"]] for p in positions[name])
+        for name in zones
+        if positions.get(name)
+    }
+
+
+def _consult_decision(decision_id: str, zones: Optional[List[str]] = None) -> Any:
+    """
+    Récupère une décision Judilibre en passant par le cache mémoire puis par le cache disque
+    lorsqu'il est actif.
+
+    Les caches conservent la réponse brute (avec les positions des zones) ; le nettoyage est
+    appliqué au retour. Si zones est fourni, seul le texte de ces zones est retourné
+    (champ "zones_text") à la place du texte intégral.
+    """
+    decision = _decision_memory_cache.get(decision_id)
+    disk_cache = _get_decision_cache() if decision is None else None
+
+    if decision is None and disk_cache is not None:
+        decision = disk_cache.get(decision_id)
+        if decision is not None:
+            _decision_memory_cache.set(decision_id, decision)
+
+    if decision is None:
+        decision = judilibreapi.consult(decision_id=decision_id, clean=False)
+        if decision:
+            _decision_memory_cache.set(decision_id, decision)
+            if disk_cache is not None:
+                disk_cache.set(decision_id, decision)
+
+    # Décision absente : rien à extraire, la réponse vide de l'API est retournée telle quelle
+    if not zones or not decision:
+        return judilibreapi.clean(decision)
+
+    zones_text = _extract_zones(decision, zones)
+    result = judilibreapi.clean(
+        {k: v for k, v in decision.items() if k not in ("text", "zones")}
+    ) or {}
+    result["zones_text"] = zones_text
+    return result
+
+
+@mcp.tool
+@run_in_thread
+@require_judilibre({"erreur": "Erreur récupération décision"})
+def consulter_decision_judilibre(
+    decision_id: str,
+    zones: Optional[List[str]] = None,
+    champs: Optional[List[str]] = None,
+) -> Any:
+    """
+    Récupère le contenu d'une décision de justice depuis Judilibre.
+
+    Cette fonction est la DEUXIÈME ÉTAPE après rechercher_jurisprudence_judilibre() pour obtenir le texte complet.
+
+    Args:
+        decision_id: ID unique de la décision (champ 'id' des résultats de recherche)
+        zones: Zones à retourner au lieu du texte intégral. Valeurs: introduction, expose,
+            moyens, motivations, dispositif, annexes. Ex: ["motivations", "dispositif"]. Défaut : None
+        champs: Champs à conserver dans la réponse (ex: ["id", "decision_date", "solution", "zones_text"]).
+            Défaut : None (tous les champs)
+
+    Returns:
+        La décision complète, ou ses métadonnées et le texte des zones demandées (zones_text).
+
+    """
+    logger.debug(
+        "APPEL: consulter_decision_judilibre(decision_id=%r, zones=%r, champs=%r)",
+        decision_id, zones, champs,
+    )
+
+    if not decision_id or decision_id.isspace():
+        logger.error("ID décision vide")
+        return _ERR_ID_DECISION_VIDE
+
+    decision_id = decision_id.strip()
+    if not _DECISION_ID_RE.match(decision_id):
+        logger.error("Format d'ID décision invalide: '%s'", decision_id)
+        return _invalid_decision_id(decision_id)
+
+    for zone in zones or ():
+        if zone not in _ZONES:
+            logger.error("Zone de décision invalide: '%s'", zone)
+            return {"erreur": f"zone invalide: '{zone}'. Valeurs: {', '.join(sorted(_ZONES))}"}
+
+    decision = _consult_decision(decision_id, zones=zones)
+    return _select(decision, champs)
+
+
+# Nombre maximal de décisions récupérées en parallèle
+_BATCH_MAX_WORKERS = 8
+
+
+def _consult_decision_safe(decision_id: str) -> Any:
+    """
+    Récupère une décision sans lever d'exception : une erreur est retournée sous forme
+    de dict {"id", "erreur"} afin qu'un échec n'interrompe pas tout le lot.
+    """
+    try:
+        if not decision_id or decision_id.isspace():
+            return {"id": decision_id, "erreur": "L'ID de la décision ne peut pas être vide"}
+        decision_id = decision_id.strip()
+        if not _DECISION_ID_RE.match(decision_id):
+            return {"id": decision_id, **_invalid_decision_id(decision_id)}
+        return _consult_decision(decision_id)
+    except Exception as e:
+        logger.error("Erreur lors de la récupération de la décision '%s': %s", decision_id, e)
+        return {"id": decision_id, "erreur": "Erreur récupération décision"}
+
+
+@mcp.tool
+@run_in_thread
+@require_judilibre([{"erreur": "Erreur récupération décisions"}], non_init=[_ERR_JUDILIBRE_NON_INIT])
+def consulter_decision_judilibre_batch(decision_ids: List[str]) -> Any:
+    """
+    Récupère en parallèle le contenu de plusieurs décisions Judilibre.
+
+    À utiliser après rechercher_jurisprudence_judilibre() pour obtenir en un seul appel
+    le texte de plusieurs décisions au lieu d'appeler consulter_decision_judilibre() pour chacune.
+
+    Args:
+        decision_ids: Liste des ID de décisions (champ 'id' des résultats de recherche)
+
+    Returns:
+        Liste des décisions, dans l'ordre des ID fournis.
+        Une décision introuvable est remplacée par {"id": ..., "erreur": ...}.
+    """
+    logger.debug("APPEL: consulter_decision_judilibre_batch(decision_ids=%r)", decision_ids)
+
+    if not decision_ids:
+        return []
+
+    max_workers = min(_BATCH_MAX_WORKERS, len(decision_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_consult_decision_safe, decision_ids))
+
+
+@mcp.tool
+@run_in_thread
+@require_judilibre({"erreur": "Erreur lors de la recherche Judilibre"})
+def rechercher_jurisprudence_judilibre_multi(
+    recherche: Optional[str] = None,
+    juridictions: Optional[List[str]] = None,
+    chambres: Optional[List[str]] = None,
+    type_decision: Optional[str] = None,
+    solution: Optional[str] = None,
+    date_debut: Optional[str] = None,
+    date_fin: Optional[str] = None,
+    tri: str = "scorepub",
+    ordre: str = "desc",
+    nombre_resultats: int = 20,
+) -> Any:
+    """
+    Recherche de jurisprudence Judilibre sur plusieurs juridictions et/ou chambres en parallèle.
+
+    Une recherche est lancée pour chaque combinaison (juridiction, chambre) ; les résultats
+    sont fusionnés, dédoublonnés par id puis tronqués à nombre_resultats. Avec tri="score"
+    ou tri="date", les résultats fusionnés sont triés sur ce champ ; avec tri="scorepub",
+    dont le classement n'est pas exposé dans les résultats, l'ordre retourné par l'API est
+    conservé en alternant les recherches rang par rang (1er de chaque recherche, puis 2e, etc.).
+
+    Args:
+        recherche: Texte de recherche
+        juridictions: Codes juridiction (cc, ca, tj, tcom). Défaut : toutes les juridictions
+        chambres: Codes chambre (ex: ["civ1", "soc"]). Défaut : None (toutes les chambres)
+        type_decision: Type de décision (arret, ordonnance, qpc, saisie). Défaut : None
+        solution: Solution (cassation, rejet, annulation, etc.). Défaut : None
+        date_debut: Date début ISO (ex: 2023-01-15). Défaut : None
+        date_fin: Date fin ISO (ex: 2023-12-15). Défaut : None
+        tri: Ordre de tri. Valeurs: scorepub, score, date. Défaut: "scorepub"
+        ordre: Sens du tri (desc, asc). Défaut: "desc"
+        nombre_resultats: Nombre maximal de décisions retournées (max 50). Défaut: 20
+
+    Returns:
+        {"results": [...]} et, si certaines recherches ont échoué, un champ "warnings".
+    """
+    logger.debug(
+        "APPEL: rechercher_jurisprudence_judilibre_multi(recherche=%r, juridictions=%r, chambres=%r)",
+        recherche, juridictions, chambres,
+    )
+
+    nombre_resultats = _clamp_page_size(nombre_resultats)
+    try:
+        chambres = [_correct_chambre(c) for c in chambres] if chambres else chambres
+    except ValueError as e:
+        logger.error("Paramètre de recherche Judilibre invalide: %s", e)
+        return {"erreur": str(e)}
+    erreur = _check_judilibre_filters(juridictions, chambres, tri=tri, ordre=ordre)
+    if erreur:
+        logger.error("Paramètre de recherche Judilibre invalide: %s", erreur)
+        return {"erreur": erreur}
+
+    combinaisons = list(product(juridictions or _DEFAULT_JURISDICTIONS, chambres or (None,)))
+
+    def search_one(combinaison):
+        juridiction, chambre = combinaison
+        return judilibreapi.search(
             query=recherche,
-            jurisdiction=jurisdiction_list,
-            location=location_list,
-            chamber=chamber_list,
-            type=type_list,
-            theme=theme_list,
-            solution=solution_list,
+            jurisdiction=(juridiction,),
+            chamber=_wrap(chambre),
+            type=_wrap(type_decision),
+            solution=_wrap(solution),
             date_start=date_debut,
             date_end=date_fin,
             sort=tri,
             order=ordre,
             page_size=nombre_resultats,
-            page=page,
-            resolve_references=True,  # Obtenir les intitulés complets
+            resolve_references=True,
         )
 
-        return results
+    ranked = []  # Résultats de chaque recherche, dans l'ordre retourné par l'API
+    warnings = []
+    with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(combinaisons))) as executor:
+        futures = [(c, executor.submit(search_one, c)) for c in combinaisons]
+        for (juridiction, chambre), future in futures:
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.error("Erreur lors de la recherche Judilibre (%s, %s): %s", juridiction, chambre, e)
+                warnings.append(f"Recherche échouée pour juridiction={juridiction}, chambre={chambre}")
+                continue
+            if response is None:
+                continue
+            ranked.append(response.get("results") or [])
+
+    if tri == "scorepub":
+        # Alterner les recherches rang par rang conserve le classement de chacune
+        decisions = (d for rank in zip_longest(*ranked) for d in rank if d is not None)
+    else:
+        decisions = (d for results in ranked for d in results)
+
+    # Dédoublonnage par id ; une décision sans id est conservée telle quelle
+    merged = {}
+    for decision in decisions:
+        merged.setdefault(decision.get("id") or id(decision), decision)
+    results = list(merged.values())
+
+    if tri != "scorepub":
+        # Tri par date (chaînes ISO) ou par score de pertinence
+        sort_key, default = ("decision_date", "") if tri == "date" else ("score", 0)
+        results.sort(key=lambda d: d.get(sort_key) or default, reverse=(ordre == "desc"))
+    results = results[:nombre_resultats]
+
+    output = {"results": results}
+    if warnings:
+        output["warnings"] = warnings
+    return output
 
-    except Exception as e:
-        logger.error(f"Erreur lors de la recherche Judilibre: {e}")
-        return "Erreur lors de la recherche Judilibre"
 
 
-@mcp.tool
-def consulter_decision_judilibre(decision_id: str) -> Any:
-    """
-    Récupère le contenu d'une décision de justice depuis Judilibre.
+# ============================================================================
+# OUTILS DE RECHERCHE PAR LOTS
+# ============================================================================
 
-    Cette fonction est la DEUXIÈME ÉTAPE après rechercher_jurisprudence_judilibre() pour obtenir le texte complet.
+
+def _run_batch(search_fn, queries: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Exécute une fonction de recherche pour chaque requête, en parallèle.
 
     Args:
-        decision_id: ID unique de la décision (champ 'id' des résultats de recherche)
+        search_fn: Fonction de recherche (_rechercher_legifrance ou _rechercher_jurisprudence_judilibre)
+        queries: Liste de dicts de paramètres passés tels quels à search_fn
 
     Returns:
-        La décision complète.
+        Liste des résultats dans l'ordre des requêtes ; une requête en échec est
+        remplacée par {"requete": ..., "erreur": ...}
+    """
+    # Les paramètres sont vérifiés avant l'appel : une TypeError levée pendant la recherche
+    # est un défaut du serveur, journalisé comme tel, et non une erreur de l'appelant
+    parameters = inspect.signature(search_fn).parameters
+    required = [
+        name for name, p in parameters.items()
+        if p.default is inspect.Parameter.empty
+        and p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    ]
+
+    def invalid_query(query: Any) -> Optional[str]:
+        if not isinstance(query, dict):
+            return "chaque requête doit être un objet de paramètres"
+        unknown = sorted(k for k in query if k not in parameters)
+        if unknown:
+            return f"paramètres inconnus: {', '.join(map(str, unknown))}"
+        missing = [name for name in required if name not in query]
+        if missing:
+            return f"paramètres obligatoires manquants: {', '.join(missing)}"
+        return None
+
+    def run_one(query: Dict[str, Any]) -> Any:
+        erreur = invalid_query(query)
+        if erreur:
+            return {"requete": query, "erreur": f"Paramètres de recherche invalides: {erreur}"}
+        try:
+            return search_fn(**query)
+        except Exception as e:
+            logger.error("Erreur lors de la recherche %r: %s", query, e)
+            return {"requete": query, "erreur": "Erreur lors de la recherche"}
+
+    if not queries:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(queries))) as executor:
+        return list(executor.map(run_one, queries))
+
 
+@mcp.tool
+@run_in_thread
+def rechercher_legifrance_batch(requetes: List[Dict[str, Any]]) -> Any:
     """
-    logger.debug(f"APPEL: obtenir_decision_judilibre(decision_id='{decision_id}')")
+    Exécute plusieurs recherches Légifrance en parallèle.
 
-    try:
-        if not decision_id or not decision_id.strip():
-            logger.error("ID décision vide")
-            return {"erreur": "L'ID de la décision ne peut pas être vide"}
+    Args:
+        requetes: Liste de recherches ; chaque élément contient les paramètres de
+            rechercher_legifrance. Ex: [{"recherche": "bail", "fond": "CODE_ETAT", "code": "Code civil"},
+            {"recherche": "congé maternité", "fond": "KALI"}]
 
-        if judilibreapi is None:
-            logger.error("API Judilibre non initialisée")
-            return {"erreur": "L'API Judilibre n'est pas initialisée"}
+    Returns:
+        Liste des résultats, dans l'ordre des requêtes. Une requête en échec est remplacée
+        par {"requete": ..., "erreur": ...}.
+    """
+    logger.debug("APPEL: rechercher_legifrance_batch(%d requêtes)", len(requetes or ()))
 
-        decision = judilibreapi.consult(decision_id=decision_id)
-        return decision
+    if legifranceapi is None:
+        logger.error("API Légifrance non initialisée")
+        return _ERR_LEGIFRANCE_NON_INIT
 
-    except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la décision '{decision_id}': {e}")
-        return {"erreur": f"Erreur récupération décision"}
+    return _run_batch(_rechercher_legifrance, requetes)
+
+
+@mcp.tool
+@run_in_thread
+@require_judilibre({"erreur": "Erreur lors de la recherche Judilibre"})
+def rechercher_jurisprudence_judilibre_batch(requetes: List[Dict[str, Any]]) -> Any:
+    """
+    Exécute plusieurs recherches de jurisprudence Judilibre en parallèle.
+
+    Args:
+        requetes: Liste de recherches ; chaque élément contient les paramètres de
+            rechercher_jurisprudence_judilibre. Ex: [{"recherche": "licenciement", "juridiction": "cc",
+            "chambre": "soc"}, {"recherche": "bail commercial", "juridiction": "ca"}]
+
+    Returns:
+        Liste des résultats, dans l'ordre des requêtes. Une requête en échec est remplacée
+        par {"requete": ..., "erreur": ...}.
+    """
+    logger.debug("APPEL: rechercher_jurisprudence_judilibre_batch(%d requêtes)", len(requetes or ()))
+
+    return _run_batch(_rechercher_jurisprudence_judilibre, requetes)
 
 
 if __name__ == "__main__":
@@ -31,22 +31,24 @@ Pour exécuter les tests:
     pytest test_api_judilibre.py -v -k "taxonomy"  # Seulement les tests de taxonomie
 """
 
-import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
-from api_judilibre import JudilibreAPI
+import pytest
 
 # Marquer tous les tests comme tests d'intégration car ils appellent l'API réelle
-pytestmark = pytest.mark.integration
+# (réponses enregistrées puis rejouées par pytest-vcr, voir conftest.py)
+pytestmark = [pytest.mark.integration, pytest.mark.vcr]
 
 
 # Fixture pour partager une instance de l'API entre tous les tests
-@pytest.fixture(scope="module")
-def api():
+@pytest.fixture(scope="session")
+def api(judilibre_api):
     """
-    Fixture qui crée une instance unique de JudiLibreAPI pour tous les tests.
-    L'instance est créée une seule fois au début et réutilisée pour tous les tests.
+    Fixture qui retourne l'instance unique de JudiLibreAPI définie dans conftest.py.
+    L'instance (et son token) est créée une seule fois pour toute la session de tests.
     """
-    return JudilibreAPI(sandbox=True)
+    return judilibre_api
 
 
 def test_init_sandbox(api):
@@ -57,26 +59,6 @@ def test_init_sandbox(api):
     assert "sandbox" in api.base_url, "L'URL de base doit contenir 'sandbox'"
 
 
-def test_get_access_token(api):
-    """Test l'obtention du token d'accès OAuth"""
-    token = api.get_access_token()
-
-    assert token is not None, "Le token ne doit pas être None"
-    assert isinstance(token, str), "Le token doit être une chaîne"
-    assert len(token) > 0, "Le token ne doit pas être vide"
-    assert api.access_token == token, "Le token doit être stocké dans l'instance"
-    assert api.token_expires_at is not None, "La date d'expiration doit être définie"
-
-
-def test_token_caching(api):
-    """Test que le token est mis en cache et réutilisé"""
-
-    token1 = api.get_access_token()
-    token2 = api.get_access_token()
-
-    assert token1 == token2, "Le même token doit être réutilisé"
-
-
 def test_search_simple(api):
     """Test une recherche simple"""
 
@@ -85,106 +67,74 @@ def test_search_simple(api):
     assert results is not None, "Les résultats ne doivent pas être None"
 
 
-def test_search_with_field_filter(api):
-    """Test une recherche sur des champs spécifiques"""
-
-    results = api.search(query="dommages", field=["motivations", "dispositif"], page_size=3)
-
-    assert results is not None
-
-
-def test_search_with_operator_and(api):
-    """Test une recherche avec l'opérateur AND"""
-
-    results = api.search(query="responsabilité contractuelle", operator="and", page_size=5)
-
-    assert results is not None
-
-
-def test_search_with_operator_exact(api):
-    """Test une recherche exacte"""
-
-    results = api.search(query="Cour de cassation", operator="exact", page_size=5)
-
-    assert results is not None
-
-
-def test_search_with_date_range(api):
-    """Test une recherche avec intervalle de dates"""
-
-    results = api.search(
-        query="divorce", date_start="2020-01-01", date_end="2023-12-31", page_size=5
-    )
-
-    assert results is not None
-
-
-def test_search_with_type_filter(api):
-    """Test une recherche filtrée par type de décision"""
-
-    results = api.search(query="contrat", type=["arret"], page_size=5)
-
-    assert results is not None
-
-
-def test_search_with_chamber_civ1(api):
-    """Test une recherche dans la première chambre civile avec la clé correcte"""
-
-    results = api.search(
-        query="responsabilité contractuelle",
-        chamber=["civ1"],  # Utilisation de la CLÉ correcte
-        page_size=5,
-    )
-
-    assert results is not None
-
-
-def test_search_with_chamber_soc(api):
-    """Test une recherche dans la chambre sociale avec la clé correcte"""
-
-    results = api.search(
-        query="licenciement", chamber=["soc"], page_size=5  # Utilisation de la CLÉ correcte
-    )
-
-    assert results is not None
-
-
-def test_search_with_jurisdiction_filter(api):
-    """Test une recherche filtrée par juridiction"""
-
-    results = api.search(query="prescription", jurisdiction=["cc"], page_size=5)
-
-    assert results is not None
-
-
-def test_search_with_publication_filter(api):
-    """Test une recherche filtrée par niveau de publication"""
-
-    results = api.search(query="cassation", publication=["b"], page_size=3)  # Bulletin
-
-    assert results is not None
-
-
-def test_search_with_solution_filter(api):
-    """Test une recherche filtrée par solution"""
-
-    results = api.search(query="recours", solution=["rejet"], page_size=5)
-
-    assert results is not None
-
-
-def test_search_with_sort_date(api):
-    """Test une recherche triée par date"""
-
-    results = api.search(query="propriété", sort="date", order="desc", page_size=5)
-
-    assert results is not None
-
-
-def test_search_with_sort_score(api):
-    """Test une recherche triée par pertinence"""
-
-    results = api.search(query="préjudice", sort="score", order="desc", page_size=5)
+# Variantes de recherche : un appel à api.search() par jeu de paramètres.
+# Table immuable construite une seule fois (MappingProxyType, tuples pour les filtres multiples)
+SEARCH_VARIANTS = (
+    pytest.param(
+        MappingProxyType(
+            {"query": "dommages", "field": ("motivations", "dispositif"), "page_size": 3}
+        ),
+        id="field_filter",
+    ),
+    pytest.param(
+        MappingProxyType(
+            {"query": "responsabilité contractuelle", "operator": "and", "page_size": 5}
+        ),
+        id="operator_and",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "Cour de cassation", "operator": "exact", "page_size": 5}),
+        id="operator_exact",
+    ),
+    pytest.param(
+        MappingProxyType(
+            {"query": "divorce", "date_start": "2020-01-01", "date_end": "2023-12-31", "page_size": 5}
+        ),
+        id="date_range",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "contrat", "type": ("arret",), "page_size": 5}),
+        id="type_filter",
+    ),
+    # Chambres : utilisation de la CLÉ correcte (civ1, soc)
+    pytest.param(
+        MappingProxyType(
+            {"query": "responsabilité contractuelle", "chamber": ("civ1",), "page_size": 5}
+        ),
+        id="chamber_civ1",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "licenciement", "chamber": ("soc",), "page_size": 5}),
+        id="chamber_soc",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "prescription", "jurisdiction": ("cc",), "page_size": 5}),
+        id="jurisdiction_filter",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "cassation", "publication": ("b",), "page_size": 3}),  # Bulletin
+        id="publication_filter",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "recours", "solution": ("rejet",), "page_size": 5}),
+        id="solution_filter",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "propriété", "sort": "date", "order": "desc", "page_size": 5}),
+        id="sort_date",
+    ),
+    pytest.param(
+        MappingProxyType({"query": "préjudice", "sort": "score", "order": "desc", "page_size": 5}),
+        id="sort_score",
+    ),
+)
+
+
+@pytest.mark.parametrize("kwargs", SEARCH_VARIANTS)
+def test_search_variants(api, kwargs):
+    """Test une recherche avec filtre, opérateur, intervalle de dates ou tri"""
+
+    results = api.search(**kwargs)
 
     assert results is not None
 
@@ -192,11 +142,12 @@ def test_search_with_sort_score(api):
 def test_search_pagination(api):
     """Test la pagination des résultats"""
 
-    # Première page
-    results_page1 = api.search(query="contrat", page=0, page_size=3)
-
-    # Deuxième page
-    results_page2 = api.search(query="contrat", page=1, page_size=3)
+    # Les deux pages sont demandées en parallèle : la deuxième est prête pendant la vérification de la première
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_page1 = executor.submit(api.search, query="contrat", page=0, page_size=3)
+        future_page2 = executor.submit(api.search, query="contrat", page=1, page_size=3)
+        results_page1 = future_page1.result()
+        results_page2 = future_page2.result()
 
     assert results_page1 is not None
     assert results_page2 is not None
@@ -259,111 +210,45 @@ def test_search_invalid_page_size(api):
         api.search(query="test", page_size=100)
 
 
-def test_search_invalid_operator(api):
-    """Test qu'une erreur est levée pour un opérateur invalide"""
-
-    with pytest.raises(ValueError, match="operator doit être"):
-        api.search(query="test", operator="invalid")
-
-
-def test_search_invalid_sort(api):
-    """Test qu'une erreur est levée pour un tri invalide"""
-
-    with pytest.raises(ValueError, match="sort doit être"):
-        api.search(query="test", sort="invalid")
-
-
-def test_search_invalid_order(api):
-    """Test qu'une erreur est levée pour un ordre invalide"""
-
-    with pytest.raises(ValueError, match="order doit être"):
-        api.search(query="test", order="invalid")
-
-
-def test_decision_with_resolve_references(api):
-    """Test la récupération d'une décision avec références résolues"""
-
-    # Obtenir un ID valide
+@pytest.fixture(scope="session")
+def sample_decision_id(api):
+    """
+    ID d'une décision existante dans la sandbox, obtenu par une seule recherche
+    pour toute la session et partagé par les tests de consultation.
+    """
     search_results = api.search(query="contrat", page_size=1)
+    results = (search_results or {}).get("results") or []
+    if not results or not results[0].get("id"):
+        pytest.skip("Aucune décision disponible dans la sandbox")
+    return results[0]["id"]
 
-    if search_results and "results" in search_results and len(search_results["results"]) > 0:
-        decision_id = search_results["results"][0].get("id")
-        if decision_id:
-            decision = api.consult(decision_id, resolve_references=True)
-            assert decision is not None
 
+def test_decision_with_resolve_references(api, sample_decision_id):
+    """Test la récupération d'une décision avec références résolues"""
 
-def test_decision_with_query_highlight(api):
-    """Test la récupération d'une décision avec surlignage de termes"""
+    decision = api.consult(sample_decision_id, resolve_references=True)
 
-    # Obtenir un ID valide
-    search_results = api.search(query="divorce", page_size=1)
-    decision_id = search_results["results"][0].get("id")
-    decision = api.consult(decision_id, query="divorce", operator="or")
     assert decision is not None
 
 
-def test_decision_empty_id(api):
-    """Test qu'une erreur est levée si l'ID est vide"""
-
-    with pytest.raises(ValueError, match="L'identifiant de la décision est obligatoire"):
-        api.consult("")
-
-
-def test_decision_invalid_operator(api):
-    """Test qu'une erreur est levée pour un opérateur invalide dans decision()"""
-
-    with pytest.raises(ValueError, match="operator doit être"):
-        api.consult("test_id", query="test", operator="invalid")
-
-
-def test_taxonomy_jurisdiction(api):
-    """Test la récupération de la taxonomie des juridictions"""
-
-    jurisdictions = api.taxonomy("jurisdiction")
-
-    assert jurisdictions is not None
-    assert isinstance(jurisdictions, (dict, list))
-
-
-def test_taxonomy_chamber(api):
-    """Test la récupération de la taxonomie des chambres"""
-
-    chambers = api.taxonomy("chamber")
-
-    assert chambers is not None
-
-
-def test_taxonomy_type(api):
-    """Test la récupération de la taxonomie des types de décision"""
-
-    types = api.taxonomy("type")
-
-    assert types is not None
-
-
-def test_taxonomy_publication(api):
-    """Test la récupération de la taxonomie des niveaux de publication"""
-
-    publications = api.taxonomy("publication")
-
-    assert publications is not None
-
-
-def test_taxonomy_solution(api):
-    """Test la récupération de la taxonomie des solutions"""
+def test_decision_with_query_highlight(api, sample_decision_id):
+    """Test la récupération d'une décision avec surlignage de termes"""
 
-    solutions = api.taxonomy("solution")
+    decision = api.consult(sample_decision_id, query="contrat", operator="or")
 
-    assert solutions is not None
+    assert decision is not None
 
 
-def test_taxonomy_field(api):
-    """Test la récupération de la taxonomie des champs"""
+@pytest.mark.parametrize(
+    "taxonomy_id", ["jurisdiction", "chamber", "type", "publication", "solution", "field"]
+)
+def test_taxonomy(api, taxonomy_id):
+    """Test la récupération d'une taxonomie (juridictions, chambres, types, publications, solutions, champs)"""
 
-    fields = api.taxonomy("field")
+    taxonomy = api.taxonomy(taxonomy_id)
 
-    assert fields is not None
+    assert taxonomy is not None
+    assert isinstance(taxonomy, (dict, list))
 
 
 def test_taxonomy_with_key(api):
@@ -391,50 +276,21 @@ def test_taxonomy_with_context(api):
     assert chambers_cc is not None
 
 
-def test_taxonomy_key_and_value_mutually_exclusive(api):
-    """Test que key et value sont mutuellement exclusifs"""
-
-    with pytest.raises(ValueError, match="mutuellement exclusifs"):
-        api.taxonomy("jurisdiction", key="cc", value="cour de cassation")
-
-
-def test_taxonomy_key_requires_id(api):
-    """Test que key nécessite taxonomy_id"""
-
-    with pytest.raises(ValueError, match="taxonomy_id' est requis"):
-        api.taxonomy(key="cc")
-
-
-def test_taxonomy_value_requires_id(api):
-    """Test que value nécessite taxonomy_id"""
-
-    with pytest.raises(ValueError, match="taxonomy_id' est requis"):
-        api.taxonomy(value="cour de cassation")
-
-
 if __name__ == "__main__":
-    # Permet d'exécuter directement le fichier pour des tests rapides
-    print("Exécution des tests JudiLibre...")
-
-    # Créer une instance unique de l'API pour tous les tests
-    api_instance = JudilibreAPI(sandbox=True)
-
-    print("\nTest 1: Initialisation")
-    test_init_sandbox(api_instance)
-    print("✓ Réussi")
-
-    print("\nTest 2: Obtention du token")
-    test_get_access_token(api_instance)
-    print("✓ Réussi")
-
-    print("\nTest 3: Recherche simple")
-    test_search_simple(api_instance)
-    print("✓ Réussi")
-
-    print("\nTest 4: Recherche avec filtres de date")
-    test_search_with_date_range(api_instance)
-    print("✓ Réussi")
-
-    print("\n✓ Tous les tests de base sont réussis!")
-    print("\nPour exécuter tous les tests avec pytest:")
-    print("  pytest test_api_judilibre.py -v")
+    # Permet d'exécuter directement le fichier pour des tests rapides : les tests de base
+    # passent par pytest, avec les mêmes fixtures (un seul client et un seul token)
+    import os
+    import sys
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.exit(
+        pytest.main(
+            [
+                __file__,
+                os.path.join(here, "test_oauth_common.py"),
+                "-v",
+                "-k",
+                "test_init_sandbox or test_search_simple or date_range or (test_get_access_token and judilibre_api)",
+            ]
+        )
+    )
@@ -10,22 +10,25 @@ Pour exécuter les tests:
     pytest test_api_legifrance.py -v -k "test_search"  # Seulement les tests de recherche
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from api_legifrance import LegifranceAPI
 
 # Marquer tous les tests comme tests d'intégration car ils appellent l'API réelle
-pytestmark = pytest.mark.integration
+# (réponses enregistrées puis rejouées par pytest-vcr, voir conftest.py)
+pytestmark = [pytest.mark.integration, pytest.mark.vcr]
 
 
 # Fixture pour partager une instance de l'API entre tous les tests
-@pytest.fixture(scope="module")
-def api():
+@pytest.fixture(scope="session")
+def api(legifrance_api):
     """
-    Fixture qui crée une instance unique de JudiLibreAPI pour tous les tests.
-    L'instance est créée une seule fois au début et réutilisée pour tous les tests.
+    Fixture qui retourne l'instance unique de LegifranceAPI définie dans conftest.py.
+    L'instance (et son token) est créée une seule fois pour toute la session de tests.
     """
-    return LegifranceAPI(sandbox=True)
+    return legifrance_api
 
 
 def test_init_sandbox(api):
@@ -34,26 +37,8 @@ def test_init_sandbox(api):
     assert api.client_id is not None, "Le client_id doit être défini"
     assert api.client_secret is not None, "Le client_secret doit être défini"
     assert "sandbox" in api.base_url, "L'URL de base doit contenir 'sandbox'"
-    assert api.access_token is None, "Le token doit être None avant authentification"
-
-
-def test_get_access_token(api):
-    """Test l'obtention du token d'accès OAuth"""
-    token = api.get_access_token()
-
-    assert token is not None, "Le token ne doit pas être None"
-    assert isinstance(token, str), "Le token doit être une chaîne"
-    assert len(token) > 0, "Le token ne doit pas être vide"
-    assert api.access_token == token, "Le token doit être stocké dans l'instance"
-    assert api.token_expires_at is not None, "La date d'expiration doit être définie"
-
-
-def test_token_caching(api):
-    """Test que le token est mis en cache et réutilisé"""
-    token1 = api.get_access_token()
-    token2 = api.get_access_token()
-
-    assert token1 == token2, "Le même token doit être réutilisé"
+    # Le client de session a déjà son token : vérifier l'état initial sur un client neuf
+    assert LegifranceAPI(sandbox=True).access_token is None, "Le token doit être None avant authentification"
 
 
 def test_search_simple(api):
@@ -92,11 +77,16 @@ def test_search_with_date_filters(api):
 def test_search_pagination(api):
     """Test la pagination des résultats"""
 
-    # Première page
-    results_page1 = api.search(query="contrat", fond="CODE_ETAT", page_number=1, page_size=3)
-
-    # Deuxième page
-    results_page2 = api.search(query="contrat", fond="CODE_ETAT", page_number=2, page_size=3)
+    # Les deux pages sont demandées en parallèle : la deuxième est prête pendant la vérification de la première
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_page1 = executor.submit(
+            api.search, query="contrat", fond="CODE_ETAT", page_number=1, page_size=3
+        )
+        future_page2 = executor.submit(
+            api.search, query="contrat", fond="CODE_ETAT", page_number=2, page_size=3
+        )
+        results_page1 = future_page1.result()
+        results_page2 = future_page2.result()
 
     assert results_page1 is not None
     assert results_page2 is not None
@@ -177,41 +167,6 @@ def test_article_JORF(api):
     assert result is not None  
 
 
-def test_search_invalid_fond(api):
-    """Test qu'une erreur est levée pour un fond invalide"""
-
-    with pytest.raises(ValueError, match="Fond invalide"):
-        api.search(query="test", fond="INVALID_FOND")
-
-
-def test_search_invalid_search_type(api):
-    """Test qu'une erreur est levée pour un type de recherche invalide"""
-
-    with pytest.raises(ValueError, match="Type de recherche invalide"):
-        api.search(query="test", search_type="INVALID_TYPE")
-
-
-def test_search_invalid_field_type(api):
-    """Test qu'une erreur est levée pour un type de champ invalide"""
-
-    with pytest.raises(ValueError, match="Type de champ invalide"):
-        api.search(query="test", field_type="INVALID_CHAMP")
-
-
-def test_search_no_query(api):
-    """Test qu'une erreur est levée si aucune query n'est fournie"""
-
-    with pytest.raises(ValueError, match="Le paramètre 'recherche' doit être fourni"):
-        api.search()
-
-
-def test_search_invalid_operator(api):
-    """Test qu'une erreur est levée pour un opérateur invalide"""
-
-    with pytest.raises(ValueError, match="L'opérateur doit être"):
-        api.search(query="test", operator="INVALID")
-
-
 def test_search_with_sort(api):
     """Test la recherche avec tri personnalisé"""
 
@@ -237,25 +192,20 @@ def test_search_jurisprudence(api):
 
 
 if __name__ == "__main__":
-    # Permet d'exécuter directement le fichier pour des tests rapides
-    print("Exécution des tests...")
-    api_instance = LegifranceAPI(sandbox=True)
-    print("\nTest 1: Initialisation")
-    test_init_sandbox(api_instance)
-    print("✓ Réussi")
-
-    print("\nTest 2: Obtention du token")
-    test_get_access_token(api_instance)
-    print("✓ Réussi")
-
-    print("\nTest 3: Recherche simple")
-    test_search_simple(api_instance)
-    print("✓ Réussi")
-
-    print("\nTest 4: Recherche avec filtres")
-    test_search_with_filters(api_instance)
-    print("✓ Réussi")
-
-    print("\n✓ Tous les tests de base sont réussis!")
-    print("\nPour exécuter tous les tests avec pytest:")
-    print("  pytest test_api_legifrance.py -v")
+    # Permet d'exécuter directement le fichier pour des tests rapides : les tests de base
+    # passent par pytest, avec les mêmes fixtures (un seul client et un seul token)
+    import os
+    import sys
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.exit(
+        pytest.main(
+            [
+                __file__,
+                os.path.join(here, "test_oauth_common.py"),
+                "-v",
+                "-k",
+                "test_init_sandbox or test_search_simple or test_search_with_filters or (test_get_access_token and legifrance_api)",
+            ]
+        )
+    )
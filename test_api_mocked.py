@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires des clients Légifrance et JudiLibre, sans accès réseau.
+Les appels HTTP (token OAuth compris) sont interceptés par la bibliothèque responses
+et reçoivent des réponses JSON préenregistrées : aucun credential n'est nécessaire.
+
+Pour exécuter les tests:
+    pytest test_api_mocked.py -v
+    pytest -m unit  # Seulement les tests unitaires (tous fichiers)
+    pytest -m "not integration"  # Tout sauf les tests qui appellent l'API réelle
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from responses.registries import OrderedRegistry
+
+from api_judilibre import JudilibreAPI
+from api_legifrance import LegifranceAPI
+from conftest import _prime_token
+
+# Marquer tous les tests comme tests unitaires (mocks seulement)
+pytestmark = pytest.mark.unit
+
+TOKEN_URL = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
+JUDILIBRE_URL = "https://sandbox-api.piste.gouv.fr/cassation/judilibre/v1.0"
+LEGIFRANCE_URL = "https://sandbox-api.piste.gouv.fr/dila/legifrance/lf-engine-app"
+
+# Réponses préenregistrées (extraits de réponses réelles de la sandbox)
+JUDILIBRE_SEARCH = {
+    "page": 0,
+    "page_size": 10,
+    "total": 1,
+    "results": [
+        {
+            "id": "5fca7e0d4b6b4a1e8c0b0d1a",
+            "jurisdiction": "cc",
+            "chamber": "civ1",
+            "decision_date": "2023-03-15",
+            "solution": "rejet",
+            "score": 12.5,
+            "highlights": {"text": ["la <em>responsabilité</em> civile"]},
+            "files": [],
+        }
+    ],
+}
+JUDILIBRE_DECISION = {
+    "id": "5fca7e0d4b6b4a1e8c0b0d1a",
+    "jurisdiction": "cc",
+    "text": "Texte intégral de la décision",
+    "zones": {"dispositif": [{"start": 0, "end": 5}]},
+    "decision_date": "2023-03-15",
+}
+JUDILIBRE_TAXONOMY = {
+    "id": "jurisdiction",
+    "result": {"cc": "Cour de cassation", "ca": "Cour d'appel"},
+}
+LEGIFRANCE_SEARCH = {
+    "totalResultNumber": 1,
+    "results": [
+        {
+            "titles": [{"id": "LEGIARTI000006419292", "title": "Article <mark>1240</mark>"}],
+            "nature": "CODE",
+            "etat": None,
+        }
+    ],
+}
+LEGIFRANCE_ARTICLE = {
+    "article": {
+        "id": "LEGIARTI000006419292",
+        "texte": "Tout fait quelconque de l'homme...",
+        "num": "1240",
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    """
+    Credentials factices : seuls les appels interceptés par responses les reçoivent.
+    Le cache disque du token est désactivé pour que chaque test parte sans token.
+    """
+    monkeypatch.setenv("PISTE_SANDBOX_CLIENT_ID", "client-id")
+    monkeypatch.setenv("PISTE_SANDBOX_CLIENT_SECRET", "client-secret")
+    monkeypatch.setenv("DROIT_FRANCAIS_MCP_NO_CACHE", "1")
+
+
+@pytest.fixture
+def http():
+    """
+    Intercepte tous les appels HTTP du test. Le token OAuth est toujours accordé ;
+    chaque test enregistre les réponses des endpoints qu'il appelle.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(
+            responses.POST,
+            TOKEN_URL,
+            json={"access_token": "fake-token", "expires_in": 3600},
+        )
+        yield rsps
+
+
+@pytest.fixture
+def judilibre():
+    return JudilibreAPI(sandbox=True)
+
+
+@pytest.fixture
+def legifrance():
+    return LegifranceAPI(sandbox=True)
+
+
+def _token_calls(rsps):
+    return [call for call in rsps.calls if call.request.url == TOKEN_URL]
+
+
+def test_judilibre_search(http, judilibre):
+    """La recherche envoie le token et retourne les résultats nettoyés"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/search", json=JUDILIBRE_SEARCH)
+
+    results = judilibre.search(query="responsabilité", page_size=10)
+
+    assert results["results"][0]["id"] == "5fca7e0d4b6b4a1e8c0b0d1a"
+    assert results["results"][0]["solution"] == "rejet"
+    assert "files" not in results["results"][0], "Les valeurs vides doivent être supprimées"
+    assert http.calls[-1].request.headers["Authorization"] == "Bearer fake-token"
+
+
+def test_judilibre_token_reused(http, judilibre):
+    """Le token OAuth n'est demandé qu'une fois pour plusieurs appels"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/search", json=JUDILIBRE_SEARCH)
+
+    judilibre.search(query="contrat")
+    judilibre.search(query="bail")
+
+    assert len(_token_calls(http)) == 1
+
+
+def test_judilibre_consult(http, judilibre):
+    """La consultation retourne la décision, brute si clean=False"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/decision", json=JUDILIBRE_DECISION)
+
+    decision = judilibre.consult("5fca7e0d4b6b4a1e8c0b0d1a")
+    raw = judilibre.consult("5fca7e0d4b6b4a1e8c0b0d1a", clean=False)
+
+    assert decision["text"] == "Texte intégral de la décision"
+    assert "zones" in raw
+
+
+def test_judilibre_taxonomy(http, judilibre):
+    """La taxonomie retourne le contenu du champ result"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/taxonomy", json=JUDILIBRE_TAXONOMY)
+
+    result = judilibre.taxonomy(taxonomy_id="jurisdiction")
+
+    assert result == {"cc": "Cour de cassation", "ca": "Cour d'appel"}
+
+
+def test_judilibre_taxonomy_many(http, judilibre):
+    """Plusieurs taxonomies sont retournées dans l'ordre des specs, avec un seul token"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/taxonomy", json=JUDILIBRE_TAXONOMY)
+
+    results = judilibre.taxonomy_many([
+        {"taxonomy_id": "jurisdiction"},
+        {"taxonomy_id": "jurisdiction", "key": "cc"},
+        {},
+    ])
+
+    assert results[0] == JUDILIBRE_TAXONOMY["result"]
+    assert results[1] == JUDILIBRE_TAXONOMY["result"]
+    assert "jurisdiction" in results[2], "Sans paramètre : liste des taxonomies disponibles"
+    assert len(_token_calls(http)) == 1
+
+
+def test_judilibre_taxonomy_cached(http, judilibre):
+    """Une taxonomie déjà reçue est servie par le cache jusqu'à clear_cache()"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/taxonomy", json=JUDILIBRE_TAXONOMY)
+
+    first = judilibre.taxonomy(taxonomy_id="jurisdiction")
+    first["cc"] = "modifié"
+    second = judilibre.taxonomy(taxonomy_id="jurisdiction")
+
+    taxonomy_calls = [c for c in http.calls if "/taxonomy" in c.request.url]
+    assert len(taxonomy_calls) == 1
+    assert second["cc"] == "Cour de cassation", "Le cache retourne une copie"
+
+    judilibre.clear_cache()
+    judilibre.taxonomy(taxonomy_id="jurisdiction")
+    taxonomy_calls = [c for c in http.calls if "/taxonomy" in c.request.url]
+    assert len(taxonomy_calls) == 2
+
+
+def test_judilibre_cache_expires(http, judilibre, monkeypatch):
+    """Une entrée du cache n'est plus servie après cache_ttl secondes"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/taxonomy", json=JUDILIBRE_TAXONOMY)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    judilibre.taxonomy(taxonomy_id="jurisdiction")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + judilibre.cache_ttl + 1)
+    judilibre.taxonomy(taxonomy_id="jurisdiction")
+
+    taxonomy_calls = [c for c in http.calls if "/taxonomy" in c.request.url]
+    assert len(taxonomy_calls) == 2
+
+
+def test_judilibre_cache_disabled(http):
+    """cache_ttl=0 désactive les caches du client"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/taxonomy", json=JUDILIBRE_TAXONOMY)
+    judilibre = JudilibreAPI(sandbox=True, cache_ttl=0)
+
+    judilibre.taxonomy(taxonomy_id="jurisdiction")
+    judilibre.taxonomy(taxonomy_id="jurisdiction")
+
+    taxonomy_calls = [c for c in http.calls if "/taxonomy" in c.request.url]
+    assert len(taxonomy_calls) == 2
+
+
+def test_judilibre_http_error(http, judilibre):
+    """Une erreur HTTP de l'API est convertie en exception"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/search", status=400, json={"message": "bad"})
+
+    with pytest.raises(Exception, match="Erreur lors de la recherche JudiLibre"):
+        judilibre.search(query="contrat")
+
+
+@pytest.mark.parametrize("api_class", [JudilibreAPI, LegifranceAPI])
+def test_token_disk_cache(http, tmp_path, api_class):
+    """Le token enregistré sur disque est réutilisé par une nouvelle instance"""
+    first = api_class(sandbox=True)
+    first.token_cache_path = str(tmp_path / "token.json")
+    first.get_access_token()
+
+    second = api_class(sandbox=True)
+    second.token_cache_path = first.token_cache_path
+
+    assert second.get_access_token() == "fake-token"
+    assert len(_token_calls(http)) == 1, "Le token doit être relu depuis le disque"
+    if os.name == "posix":
+        assert os.stat(first.token_cache_path).st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize("api_class", [JudilibreAPI, LegifranceAPI])
+def test_token_disk_cache_expired(http, tmp_path, api_class):
+    """Un token expiré sur disque est ignoré et un nouveau token est demandé"""
+    cache_path = tmp_path / "token.json"
+    cache_path.write_text('{"access_token": "old-token", "expires_at": 0}', encoding="utf-8")
+
+    api = api_class(sandbox=True)
+    api.token_cache_path = str(cache_path)
+
+    assert api.get_access_token() == "fake-token"
+    assert len(_token_calls(http)) == 1
+
+
+@pytest.mark.parametrize("api_class", [JudilibreAPI, LegifranceAPI])
+def test_token_requested_once_by_concurrent_calls(http, api_class):
+    """Des appels simultanés à prime() ne déclenchent qu'une demande de token"""
+    api = api_class(sandbox=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: api.prime(), range(8)))
+
+    assert api.access_token == "fake-token"
+    assert len(_token_calls(http)) == 1
+
+
+@pytest.mark.parametrize("api_class", [JudilibreAPI, LegifranceAPI])
+def test_replay_token_needs_no_request(http, api_class):
+    """En rejeu (--vcr-record=none), le client de session reçoit le token factice sans appel"""
+    api = _prime_token(api_class(sandbox=True), "none")
+
+    assert api.get_access_token() == "REDACTED"
+    assert not _token_calls(http), "Aucune cassette ne doit contenir la demande de token"
+
+
+@pytest.mark.parametrize("api_class", [JudilibreAPI, LegifranceAPI])
+def test_record_token_requested_before_cassettes(http, api_class):
+    """En enregistrement, le vrai token est demandé à la création du client de session"""
+    api = _prime_token(api_class(sandbox=True), None)
+
+    assert api.access_token == "fake-token"
+    assert len(_token_calls(http)) == 1
+
+
+@pytest.mark.parametrize("api_class", [JudilibreAPI, LegifranceAPI])
+def test_record_token_falls_back_to_replay_token(api_class):
+    """Sans accès au serveur OAuth, les cassettes existantes restent rejouables"""
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, TOKEN_URL, status=401)
+        api = _prime_token(api_class(sandbox=True), "once")
+
+    assert api.access_token == "REDACTED"
+
+
+def test_legifrance_search(http, legifrance):
+    """La recherche retourne les résultats sans balises de surlignage"""
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/search", json=LEGIFRANCE_SEARCH)
+
+    results = legifrance.search(query="responsabilité", fond="CODE_ETAT", code="Code civil")
+
+    title = results["results"][0]["titles"][0]
+    assert title["id"] == "LEGIARTI000006419292"
+    assert title["title"] == "Article 1240"
+    assert http.calls[-1].request.headers["Authorization"] == "Bearer fake-token"
+
+
+def _search_by_fond(http):
+    """Répond à /search avec LEGIFRANCE_SEARCH, ou une erreur 400 pour le fond "INVALIDE"."""
+    def callback(request):
+        if json.loads(request.body)["fond"] == "INVALIDE":
+            return 400, {}, json.dumps({"message": "fond inconnu"})
+        return 200, {}, json.dumps(LEGIFRANCE_SEARCH)
+
+    http.add_callback(responses.POST, f"{LEGIFRANCE_URL}/search", callback=callback)
+
+
+def test_legifrance_submit_many(http, legifrance):
+    """Les requêtes sont envoyées en parallèle et les résultats retournés dans l'ordre"""
+    _search_by_fond(http)
+
+    results = legifrance.submit_many([{"fond": "CODE_ETAT"}, {"fond": "JORF"}], clean=False)
+
+    assert [r["totalResultNumber"] for r in results] == [1, 1]
+
+
+def test_legifrance_submit_many_return_exceptions(http, legifrance):
+    """Avec return_exceptions, une requête en échec n'interrompt pas les autres"""
+    _search_by_fond(http)
+    queries = [{"fond": "CODE_ETAT"}, {"fond": "INVALIDE"}]
+
+    with pytest.raises(Exception, match="Erreur HTTP 400"):
+        legifrance.submit_many(queries)
+    results = legifrance.submit_many(queries, clean=False, return_exceptions=True)
+
+    assert results[0]["totalResultNumber"] == 1
+    assert isinstance(results[1], Exception) and "Erreur HTTP 400" in str(results[1])
+
+
+def test_legifrance_search_iter(http, legifrance):
+    """Les pages sont parcourues dans l'ordre et le parcours s'arrête sur une page incomplète"""
+    def page(*ids):
+        return {"results": [{"titles": [{"id": id_, "title": id_}]} for id_ in ids]}
+
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/search", json=page("LEGIARTI1", "LEGIARTI2"))
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/search", json=page("LEGIARTI3"))
+
+    pages = list(legifrance.search_iter(query="contrat", fond="CODE_ETAT", page_size=2))
+
+    search_calls = [c for c in http.calls if c.request.url.endswith("/search")]
+    assert [len(p["results"]) for p in pages] == [2, 1]
+    assert [json.loads(c.request.body)["recherche"]["pageNumber"] for c in search_calls] == [1, 2]
+
+
+def test_legifrance_search_iter_rejects_page_number(legifrance):
+    """La pagination est gérée par search_iter"""
+    with pytest.raises(ValueError, match="page_number"):
+        next(legifrance.search_iter(query="contrat", page_number=3))
+
+
+def test_legifrance_consult(http, legifrance):
+    """Un LEGIARTI est récupéré via l'endpoint getArticle"""
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/consult/getArticle", json=LEGIFRANCE_ARTICLE)
+
+    article = legifrance.consult("LEGIARTI000006419292")
+
+    assert article["article"]["id"] == "LEGIARTI000006419292"
+    assert "num" not in article["article"], "Les clés non autorisées doivent être supprimées"
+
+
+def test_legifrance_consult_many(http, legifrance):
+    """Les documents sont retournés par identifiant, dans l'ordre demandé, avec un seul token"""
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/consult/getArticle", json=LEGIFRANCE_ARTICLE)
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/consult/juri", json={"text": {"id": "JURITEXT000045940024"}})
+
+    documents = legifrance.consult_many(["LEGIARTI000006419292", "JURITEXT000045940024"])
+
+    assert list(documents) == ["LEGIARTI000006419292", "JURITEXT000045940024"]
+    assert documents["LEGIARTI000006419292"]["article"]["id"] == "LEGIARTI000006419292"
+    assert documents["JURITEXT000045940024"]["text"]["id"] == "JURITEXT000045940024"
+    assert len(_token_calls(http)) == 1
+
+
+def test_legifrance_retries_transient_errors(legifrance):
+    """Une erreur transitoire (503) est réessayée, y compris pour les POST Légifrance"""
+    url = f"{LEGIFRANCE_URL}/consult/getArticle"
+    with responses.RequestsMock(registry=OrderedRegistry) as rsps:
+        rsps.add(responses.POST, TOKEN_URL, json={"access_token": "fake-token", "expires_in": 3600})
+        rsps.add(responses.POST, url, status=503)
+        rsps.add(responses.POST, url, json=LEGIFRANCE_ARTICLE)
+
+        article = legifrance.consult("LEGIARTI000006419292")
+
+    assert article["article"]["id"] == "LEGIARTI000006419292"
+
+
+def test_sessions_share_retry_policy(legifrance, judilibre):
+    """Les deux clients utilisent la session commune ; seul Légifrance réessaie les POST"""
+    legifrance_retry = legifrance.session.get_adapter("https://").max_retries
+    judilibre_retry = judilibre.session.get_adapter("https://").max_retries
+
+    assert legifrance_retry.total == judilibre_retry.total == 3
+    assert "POST" in legifrance_retry.allowed_methods
+    assert "POST" not in judilibre_retry.allowed_methods
+
+
+def test_legifrance_consult_error(http, legifrance):
+    """Une erreur HTTP lors de la consultation est convertie en exception"""
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/consult/getArticle", status=404)
+
+    with pytest.raises(Exception, match="Erreur lors de la récupération de l'article"):
+        legifrance.consult("LEGIARTI000006419292")
@@ -39,8 +39,6 @@ Licensed under the MIT License
 # IMPORTS ET INITIALISATION
 # ============================================================================
 
-from time import sleep
-
 from api_judilibre import JudilibreAPI
 from api_legifrance import LegifranceAPI
 
@@ -49,46 +47,41 @@ from api_legifrance import LegifranceAPI
 # INITIALISATION API JUDILIBRE (SANDBOX)
 # ============================================================================
 # Crée une instance de l'API JudiLibre en mode sandbox
-# Le token OAuth sera récupéré automatiquement lors de la première requête
+# Le token OAuth est récupéré dès l'initialisation
 
 api = JudilibreAPI(sandbox=True)
+api.prime()
 
 # %%
 # ============================================================================
-# TEST 1: Récupération des sièges de cours d'appel
-# ============================================================================
-# Exemple: Récupérer les informations sur la Cour d'appel de Rouen
-# context_value="ca" indique qu'on cherche dans les cours d'appel
-
-api.taxonomy("location", key="ca_rouen", context_value="ca")
-
-# %%
-# ============================================================================
-# TEST 2: Lister tous les sièges de tribunaux de commerce
+# INITIALISATION API LÉGIFRANCE (PRODUCTION ET SANDBOX)
 # ============================================================================
-# Récupère la liste complète des tribunaux de commerce (tcom)
-# Utile pour connaître tous les codes de localisation disponibles
-
-api.taxonomy("location", context_value="tcom")
-
+# Une instance par environnement, créée une seule fois : les cellules suivantes
+# réutilisent le token et les connexions déjà ouvertes
 
-# %%
-# ============================================================================
-# TEST 3: Récupérer toutes les juridictions disponibles
-# ============================================================================
-# Retourne la liste complète des juridictions:
-# cc (Cour de cassation), ca (Cours d'appel), tj (Tribunaux judiciaires), etc.
-
-api.taxonomy("jurisdiction")
+api_lf = LegifranceAPI(sandbox=False)
+api_lf.prime()
+api_lf_sandbox = LegifranceAPI(sandbox=True)
+api_lf_sandbox.prime()
 
 # %%
 # ============================================================================
-# TEST 4: Récupérer les chambres des tribunaux de commerce
+# TESTS 1 à 4: Taxonomies (requêtes envoyées en parallèle)
 # ============================================================================
-# Liste les chambres spécifiques aux tribunaux de commerce
-# context_value="tcom" filtre sur les tribunaux de commerce uniquement
+# 1. Siège de la Cour d'appel de Rouen (context_value="ca" : cours d'appel)
+# 2. Liste complète des sièges de tribunaux de commerce (tcom), utile pour
+#    connaître tous les codes de localisation disponibles
+# 3. Toutes les juridictions disponibles:
+#    cc (Cour de cassation), ca (Cours d'appel), tj (Tribunaux judiciaires), etc.
+# 4. Chambres spécifiques aux tribunaux de commerce (context_value="tcom")
 
-api.taxonomy("chamber", context_value="tcom")
+ca_rouen, tcom_locations, jurisdictions, tcom_chambers = api.taxonomy_many([
+    {"taxonomy_id": "location", "key": "ca_rouen", "context_value": "ca"},
+    {"taxonomy_id": "location", "context_value": "tcom"},
+    {"taxonomy_id": "jurisdiction"},
+    {"taxonomy_id": "chamber", "context_value": "tcom"},
+])
+ca_rouen, tcom_locations, jurisdictions, tcom_chambers
 
 # %%
 # ============================================================================
@@ -117,15 +110,14 @@ decision = api.consult("60c993fe7c5a5b81c05bdfc3")
 
 # Explorer toutes les taxonomies disponibles
 # all_taxonomies = api.taxonomy()
-# for tax in all_taxonomies:
-#     print(f"{tax['key']}: {tax['description']}")
+# for key, description in all_taxonomies.items():
+#     print(f"{key}: {description}")
 
 # %%
 # ============================================================================
 # TESTS API LÉGIFRANCE - Décommenter pour tester
 # ============================================================================
-from api_legifrance import LegifranceAPI
-api_lf = LegifranceAPI(sandbox=False)
+
 # %%
 # Recherche dans le Code civil
 results = api_lf.search(query="mariage", fond="CODE_ETAT", code="Code civil" ,page_size=5)
@@ -135,37 +127,39 @@ results = api_lf.search(query="mariage", fond="CODE_ETAT", code="Code civil" ,pa
 results = api_lf.search(query="crédit", fond="JORF",   page_size=5)
 
 # %%
-# Recherche article
-article = api_lf.consult("LEGIARTI000006422500")
-text = api_lf.consult("LEGITEXT000006075116")
-text_date = api_lf.consult("LEGITEXT000006069565_31-12-2006")
-
-#%%
-text = api_lf.consult("JURITEXT000045940024")
+# Consultation d'un article, de textes et d'une décision (requêtes émises en parallèle)
+article, text, text_date, juri = api_lf.consult_many([
+    "LEGIARTI000006422500",
+    "LEGITEXT000006075116",
+    "LEGITEXT000006069565_31-12-2006",
+    "JURITEXT000045940024",
+]).values()
 
 #%%
 api_lf.search(query="télétravail", fond="KALI", page_size=3)
 
-# %%
-# Test
-from api_legifrance import LegifranceAPI
-from time import sleep
-
-api_lf = LegifranceAPI(sandbox=True)
+#%%
+# Parcours page par page : la page suivante est préchargée pendant l'exploration de la page courante
+pages = api_lf.search_iter(query="crédit", fond="JORF", page_size=5)
+first = next(pages)
 
 #%%
-api_lf.search(query="crédit consommateur 2025",fond= "JORF", page_size=2, clean=True)
+second = next(pages)
+
+# %%
+# Tests en sandbox
+api_lf_sandbox.search(query="crédit consommateur 2025",fond= "JORF", page_size=2, clean=True)
 
 #%%
-api_lf.search(query="responsabilité du courtier en crédit sur un montage in fine",fond= "ALL", page_size=2, clean=True)
+api_lf_sandbox.search(query="responsabilité du courtier en crédit sur un montage in fine",fond= "ALL", page_size=2, clean=True)
 
 #%%
-api_lf.search(query="Cour d'appel de Paris 2 avril 2025",fond= "ALL", page_size=2, clean=True)
+api_lf_sandbox.search(query="Cour d'appel de Paris 2 avril 2025",fond= "ALL", page_size=2, clean=True)
 
 
 #%%
 # Test
-result = api_lf.search(
+result = api_lf_sandbox.search(
    query="caméra vidéo de surveillance",
    fond="CNIL",
    field_type="ALL",
@@ -183,3 +177,32 @@ result
 fonds = ["ALL", "JORF", "LODA_DATE", "LODA_ETAT", "JURI", "CETAT", "JUFI", "CONSTIT", "KALI", "CIRC", "ACCO", "CNIL", "CODE_DATE","CODE_ETAT"]
 facets = ["DATE_SIGNATURE", "DATE_PUBLICATION", "DATE_PARUTION", "LODA_DATE", "LODA_ETAT", "DATE_DECISION", "DATE_ARRET", "DATE_EFFET", "DATE_CREATION", "DATE_EXPORT", "DATE_DEPOT", "DATE_DELIBERATION"]
 
+#%%
+# Balayage fonds x facettes : 168 requêtes indépendantes, émises en parallèle par submit_many
+# (les appels attendent le réseau ; la session garde jusqu'à 20 connexions ouvertes)
+from itertools import product
+from api_legifrance_query_builder import LegifranceQueryBuilder
+
+def date_facet_query(fond, facette):
+    query_builder = LegifranceQueryBuilder().set_fond(fond)
+    query_builder.add_field("ALL", [query_builder.create_criteria("contrat")])
+    query_builder.query["recherche"]["filtres"].append(
+        {"facette": facette, "dates": {"start": "2020-01-01", "end": "2020-12-31"}}
+    )
+    query_builder.set_pagination(0, 1)
+    return query_builder.build()
+
+combinaisons = list(product(fonds, facets))
+reponses = api_lf_sandbox.submit_many(
+    [date_facet_query(fond, facette) for fond, facette in combinaisons],
+    clean=False,
+    max_workers=16,
+    return_exceptions=True,
+)
+scan = {
+    combinaison: f"erreur : {str(reponse)[:80]}" if isinstance(reponse, Exception) else reponse.get("totalResultNumber")
+    for combinaison, reponse in zip(combinaisons, reponses)
+}
+
+{fond: {facette: scan[(fond, facette)] for facette in facets} for fond in fonds}
+
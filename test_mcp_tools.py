@@ -0,0 +1,688 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires des outils du serveur MCP (droit_francais_MCP), sans accès réseau.
+Les outils sont appelés directement ; les clients Légifrance et JudiLibre du module sont
+remplacés par des clients sandbox dont les appels HTTP sont interceptés par responses.
+
+Pour exécuter les tests:
+    pytest test_mcp_tools.py -v
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+import responses
+from urllib3.util.retry import Retry
+
+import droit_francais_MCP as server
+from api_judilibre import JudilibreAPI
+from api_legifrance import LegifranceAPI
+
+# Marquer tous les tests comme tests unitaires (mocks seulement)
+pytestmark = pytest.mark.unit
+
+TOKEN_URL = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
+JUDILIBRE_URL = "https://sandbox-api.piste.gouv.fr/cassation/judilibre/v1.0"
+LEGIFRANCE_URL = "https://sandbox-api.piste.gouv.fr/dila/legifrance/lf-engine-app"
+
+DECISION_ID = "5fca7e0d4b6b4a1e8c0b0d1a"
+JUDILIBRE_DECISION = {
+    "id": DECISION_ID,
+    "jurisdiction": "cc",
+    "text": "Texte intégral de la décision",
+    "zones": {"dispositif": [{"start": 0, "end": 5}]},
+    "decision_date": "2023-03-15",
+}
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    """
+    Credentials factices : seuls les appels interceptés par responses les reçoivent.
+    Les caches disque (token, décisions) sont désactivés.
+    """
+    monkeypatch.setenv("PISTE_SANDBOX_CLIENT_ID", "client-id")
+    monkeypatch.setenv("PISTE_SANDBOX_CLIENT_SECRET", "client-secret")
+    monkeypatch.setenv("DROIT_FRANCAIS_MCP_NO_CACHE", "1")
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    """Chaque test part de caches vides ; le cache disque des décisions est désactivé."""
+    server._legifrance_consult_cache.clear()
+    server._legifrance_negative_cache.clear()
+    server._decision_memory_cache.clear()
+    server._taxonomy_cached.cache_clear()
+    monkeypatch.setattr(server, "_decision_cache", None)
+
+
+@pytest.fixture
+def http():
+    """
+    Intercepte tous les appels HTTP du test. Le token OAuth est toujours accordé ;
+    chaque test enregistre les réponses des endpoints qu'il appelle.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(
+            responses.POST,
+            TOKEN_URL,
+            json={"access_token": "fake-token", "expires_in": 3600},
+        )
+        yield rsps
+
+
+@pytest.fixture
+def judilibre(monkeypatch):
+    """Client JudiLibre sandbox utilisé par les outils du serveur (sans cache, comme en production)."""
+    api = JudilibreAPI(sandbox=True, cache_ttl=0)
+    monkeypatch.setattr(server, "judilibreapi", api)
+    return api
+
+
+@pytest.fixture
+def legifrance(monkeypatch):
+    """Client Légifrance sandbox utilisé par les outils du serveur pendant le test."""
+    api = LegifranceAPI(sandbox=True)
+    monkeypatch.setattr(server, "legifranceapi", api)
+    return api
+
+
+def call(tool, **kwargs):
+    """Appelle un outil MCP (fonction asynchrone enregistrée par FastMCP)."""
+    return asyncio.run(tool.fn(**kwargs))
+
+
+def _calls(rsps, path):
+    return [c for c in rsps.calls if c.request.url.split("?")[0].endswith(path)]
+
+
+def _hit(decision_id, score, date="2023-01-01"):
+    return {"id": decision_id, "jurisdiction": "cc", "score": score, "decision_date": date}
+
+
+# ============================================================================
+# CACHES MÉMOIRE (TTL)
+# ============================================================================
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge monotone contrôlée par le test (time.monotonic du serveur)."""
+    now = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_ttl_cache_expires(clock):
+    """Une entrée expirée n'est plus retournée"""
+    cache = server._TTLCache(maxsize=10, ttl=60)
+    cache.set("k", "v")
+
+    clock[0] += 59
+    assert cache.get("k") == "v"
+    clock[0] += 2
+    assert cache.get("k") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Le cache plein évince l'entrée la moins récemment lue"""
+    cache = server._TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_consult_cache_expires(http, judilibre, clock):
+    """Une décision est servie par le cache mémoire jusqu'à l'expiration de son entrée"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/decision", json=JUDILIBRE_DECISION)
+
+    call(server.consulter_decision_judilibre, decision_id=DECISION_ID)
+    call(server.consulter_decision_judilibre, decision_id=DECISION_ID)
+    assert len(_calls(http, "/decision")) == 1
+
+    clock[0] += server._decision_memory_cache.ttl + 1
+    call(server.consulter_decision_judilibre, decision_id=DECISION_ID)
+    assert len(_calls(http, "/decision")) == 2
+
+
+# ============================================================================
+# PROJECTION DES CHAMPS (champs, zones)
+# ============================================================================
+
+
+def test_judilibre_search_champs(http, judilibre):
+    """rechercher_jurisprudence_judilibre ne garde que les champs demandés de chaque résultat"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/search", json={"results": [_hit("a" * 24, 3)], "total": 1})
+
+    result = call(
+        server.rechercher_jurisprudence_judilibre, recherche="bail", champs=["id", "score"]
+    )
+
+    assert result["results"] == [{"id": "a" * 24, "score": 3}]
+
+
+def test_consulter_legifrance_champs(legifrance, monkeypatch):
+    """consulter_legifrance ne garde que les champs de premier niveau demandés"""
+    article = {"article": {"id": "LEGIARTI000006419292", "texte": "..."}, "executionTime": 3}
+    monkeypatch.setattr(legifrance, "consult", lambda id_: article)
+
+    result = call(server.consulter_legifrance, id="LEGIARTI000006419292", champs=["article", "absent"])
+
+    assert result == {"article": article["article"]}
+
+
+def test_consulter_decision_zones_and_champs(http, judilibre):
+    """zones remplace le texte intégral par les zones demandées ; champs filtre le résultat"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/decision", json=JUDILIBRE_DECISION)
+
+    with_zones = call(
+        server.consulter_decision_judilibre, decision_id=DECISION_ID, zones=["dispositif"]
+    )
+    projected = call(
+        server.consulter_decision_judilibre, decision_id=DECISION_ID, champs=["id", "text"]
+    )
+
+    assert "text" not in with_zones
+    assert with_zones["zones_text"] == {"dispositif": "Texte"}
+    assert projected == {"id": DECISION_ID, "text": JUDILIBRE_DECISION["text"]}
+    assert len(_calls(http, "/decision")) == 1
+
+
+def test_consulter_decision_rejects_unknown_zone(http, judilibre):
+    """Une zone inconnue est signalée avec la liste des zones, sans appel à l'API"""
+    result = call(
+        server.consulter_decision_judilibre, decision_id=DECISION_ID, zones=["dispositif", "motifs"]
+    )
+
+    assert result["erreur"].startswith("zone invalide: 'motifs'. Valeurs: annexes, dispositif")
+    assert not _calls(http, "/decision")
+
+
+def test_consulter_decision_zones_of_missing_decision(judilibre, monkeypatch):
+    """Une décision vide retournée par l'API n'empêche pas l'extraction des zones"""
+    monkeypatch.setattr(judilibre, "consult", lambda decision_id, clean=True: None)
+
+    result = call(server.consulter_decision_judilibre, decision_id=DECISION_ID, zones=["dispositif"])
+
+    assert result is None
+
+
+# ============================================================================
+# TAILLE DES PAGES ET FILTRES JUDILIBRE
+# ============================================================================
+
+
+@pytest.mark.parametrize("requested, sent", [(500, 50), (0, 1), (-3, 1), (20, 20)])
+def test_search_page_size_is_clamped(http, judilibre, legifrance, monkeypatch, requested, sent):
+    """Les tailles de page hors de [1, 50] sont ramenées dans l'intervalle avant l'appel"""
+    legifrance_sizes = []
+    monkeypatch.setattr(
+        legifrance, "search", lambda **kwargs: legifrance_sizes.append(kwargs["page_size"]) or {}
+    )
+    http.add(responses.GET, f"{JUDILIBRE_URL}/search", json={"results": []})
+
+    call(server.rechercher_legifrance, recherche="bail", page_taille=requested)
+    call(server.rechercher_jurisprudence_judilibre, recherche="bail", nombre_resultats=requested)
+
+    assert legifrance_sizes == [sent]
+    query = parse_qs(urlparse(_calls(http, "/search")[0].request.url).query)
+    assert query["page_size"] == [str(sent)]
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"juridictions": ["cass"]}, "juridiction invalide: 'cass'"),
+        ({"juridictions": ["cc"], "chambres": ["civ4"]}, "chambre invalide: 'civ4'"),
+        ({"tri": "pertinence"}, "tri invalide: 'pertinence'"),
+        ({"ordre": "DESC"}, "ordre invalide: 'DESC'"),
+    ],
+)
+def test_check_judilibre_filters_rejects(kwargs, message):
+    """La première valeur invalide est signalée avec la liste des valeurs acceptées"""
+    assert server._check_judilibre_filters(**kwargs).startswith(message)
+
+
+def test_check_judilibre_filters_accepts_valid_values():
+    """Les chambres ne sont vérifiées que pour une recherche limitée à la Cour de cassation"""
+    assert server._check_judilibre_filters(["cc"], ["civ1", "soc"], tri="date", ordre="asc") is None
+    assert server._check_judilibre_filters(["ca"], ["chambre inconnue"]) is None
+
+
+def test_search_with_invalid_filter_makes_no_call(http, judilibre):
+    """Un filtre invalide est signalé par l'outil sans appel à l'API"""
+    result = call(server.rechercher_jurisprudence_judilibre, recherche="bail", tri="pertinence")
+
+    assert result[0]["erreur"].startswith("tri invalide")
+    assert not _calls(http, "/search")
+
+
+@pytest.mark.parametrize(
+    "tool, kwargs, expected",
+    [
+        ("rechercher_jurisprudence_judilibre", {"recherche": "bail"}, [server._ERR_JUDILIBRE_NON_INIT]),
+        ("consulter_decision_judilibre_batch", {"decision_ids": [DECISION_ID]}, [server._ERR_JUDILIBRE_NON_INIT]),
+        ("consulter_decision_judilibre", {"decision_id": DECISION_ID}, server._ERR_JUDILIBRE_NON_INIT),
+        ("rechercher_jurisprudence_judilibre_multi", {"recherche": "bail"}, server._ERR_JUDILIBRE_NON_INIT),
+    ],
+)
+def test_judilibre_not_initialized_keeps_error_shape(monkeypatch, tool, kwargs, expected):
+    """API non initialisée : l'erreur a la même forme (liste ou dict) que les autres erreurs de l'outil"""
+    monkeypatch.setattr(server, "judilibreapi", None)
+
+    assert call(getattr(server, tool), **kwargs) == expected
+
+
+# ============================================================================
+# CACHE DISQUE DES DÉCISIONS
+# ============================================================================
+
+
+def test_import_does_not_create_cache(tmp_path):
+    """Importer le serveur ne crée rien dans le dossier de l'utilisateur"""
+    env = {k: v for k, v in os.environ.items() if k != "DROIT_FRANCAIS_MCP_NO_CACHE"}
+    env["HOME"] = str(tmp_path)
+    subprocess.run(
+        [sys.executable, "-c", "import droit_francais_MCP"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+    assert not (tmp_path / ".cache").exists()
+
+
+@pytest.fixture
+def decision_disk_cache(monkeypatch, tmp_path):
+    """Cache disque des décisions activé dans un répertoire temporaire, ouvert au premier usage."""
+    path = tmp_path / "cache" / "decisions.sqlite3"
+    monkeypatch.delenv("DROIT_FRANCAIS_MCP_NO_CACHE")
+    monkeypatch.setattr(server, "_DECISION_CACHE_PATH", str(path))
+    monkeypatch.setattr(server, "_decision_cache", server._NOT_OPENED)
+    return path
+
+
+def test_decision_disk_cache_miss_then_hit(http, judilibre, decision_disk_cache):
+    """Une décision absente est demandée à l'API puis servie par le cache disque"""
+    http.add(responses.GET, f"{JUDILIBRE_URL}/decision", json=JUDILIBRE_DECISION)
+
+    first = call(server.consulter_decision_judilibre, decision_id=DECISION_ID)
+    assert decision_disk_cache.exists(), "Le cache est ouvert à la première consultation"
+
+    # Nouveau processus simulé : caches mémoire vides, seul le disque reste
+    server._decision_memory_cache.clear()
+    second = call(server.consulter_decision_judilibre, decision_id=DECISION_ID)
+
+    assert first == second
+    assert first["id"] == DECISION_ID
+    assert len(_calls(http, "/decision")) == 1
+
+
+def test_decision_disk_cache_disabled(http, judilibre, decision_disk_cache, monkeypatch):
+    """Avec DROIT_FRANCAIS_MCP_NO_CACHE, aucun fichier n'est créé et l'API est rappelée"""
+    monkeypatch.setenv("DROIT_FRANCAIS_MCP_NO_CACHE", "1")
+    http.add(responses.GET, f"{JUDILIBRE_URL}/decision", json=JUDILIBRE_DECISION)
+
+    call(server.consulter_decision_judilibre, decision_id=DECISION_ID)
+    server._decision_memory_cache.clear()
+    call(server.consulter_decision_judilibre, decision_id=DECISION_ID)
+
+    assert server._decision_cache is None
+    assert not decision_disk_cache.parent.exists()
+    assert len(_calls(http, "/decision")) == 2
+
+
+# ============================================================================
+# CORRECTION DES INTITULÉS DE CHAMBRES
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "chambre, expected",
+    [
+        ("civ1", "civ1"),
+        ("Première chambre civile", "civ1"),
+        ("1ère Chambre Civile", "civ1"),
+        ("1re chambre civile", "civ1"),
+        ("premiere  chambre civile", "civ1"),
+        ("DEUXIÈME CHAMBRE CIVILE", "civ2"),
+        ("3e chambre civile", "civ3"),
+        ("Chambre sociale", "soc"),
+        ("ca_paris", "ca_paris"),  # Code d'une autre juridiction : inchangé
+        (None, None),
+    ],
+)
+def test_correct_chambre(chambre, expected):
+    """Seules les correspondances exactes après normalisation sont converties"""
+    assert server._correct_chambre(chambre) == expected
+
+
+@pytest.mark.parametrize(
+    "chambre, candidates",
+    [
+        ("chambre civile", "civ1, civ2, civ3"),
+        ("chambre comerciale", "comm"),
+    ],
+)
+def test_correct_chambre_rejects_approximate_labels(chambre, candidates):
+    """Un intitulé approché n'est jamais converti silencieusement : les candidates sont listées"""
+    with pytest.raises(ValueError, match=f"Chambres proches: {candidates}"):
+        server._correct_chambre(chambre)
+
+
+def test_search_with_ambiguous_chambre(http, judilibre):
+    """La recherche n'est pas lancée sur une chambre choisie arbitrairement"""
+    result = call(
+        server.rechercher_jurisprudence_judilibre,
+        recherche="bail", juridiction="cc", chambre="chambre civile",
+    )
+
+    assert "civ1, civ2, civ3" in result[0]["erreur"]
+    assert not _calls(http, "/search")
+
+
+# ============================================================================
+# RECHERCHES PAR LOTS
+# ============================================================================
+
+
+def test_batch_rejects_invalid_parameters(http, legifrance):
+    """Une requête aux paramètres inconnus ou incomplets est signalée sans appel à l'API"""
+    results = call(
+        server.rechercher_legifrance_batch,
+        requetes=[{"recherche": "bail", "fonds": "KALI"}, {"fond": "KALI"}, "bail"],
+    )
+
+    assert "paramètres inconnus: fonds" in results[0]["erreur"]
+    assert "paramètres obligatoires manquants: recherche" in results[1]["erreur"]
+    assert "objet de paramètres" in results[2]["erreur"]
+    assert not _calls(http, "/search")
+
+
+def test_batch_internal_type_error_is_logged(caplog):
+    """Une TypeError levée pendant la recherche est journalisée comme un défaut du serveur"""
+    def search_fn(recherche, fond="ALL"):
+        return None + 1
+
+    with caplog.at_level("ERROR", logger=server.logger.name):
+        results = server._run_batch(search_fn, [{"recherche": "bail"}])
+
+    assert results == [{"requete": {"recherche": "bail"}, "erreur": "Erreur lors de la recherche"}]
+    assert "NoneType" in caplog.text
+
+
+# ============================================================================
+# RECHERCHE JUDILIBRE MULTI-JURIDICTIONS
+# ============================================================================
+
+
+def _search_by_jurisdiction(http, results):
+    """Répond à /search avec les résultats associés à la juridiction demandée (400 si absente)."""
+    def callback(request):
+        jurisdiction = parse_qs(urlparse(request.url).query)["jurisdiction"][0]
+        if jurisdiction not in results:
+            return 400, {}, json.dumps({"message": "bad"})
+        return 200, {}, json.dumps({"results": results[jurisdiction]})
+
+    http.add_callback(responses.GET, f"{JUDILIBRE_URL}/search", callback=callback)
+
+
+def test_multi_scorepub_keeps_api_order(http, judilibre):
+    """Avec scorepub, les résultats sont alternés rang par rang et dédoublonnés par id"""
+    _search_by_jurisdiction(http, {
+        "cc": [_hit("a" * 24, 1), _hit("b" * 24, 9)],
+        "ca": [_hit("c" * 24, 5), _hit("a" * 24, 1)],
+    })
+
+    result = call(
+        server.rechercher_jurisprudence_judilibre_multi, recherche="bail", juridictions=["cc", "ca"]
+    )
+
+    assert [d["id"] for d in result["results"]] == ["a" * 24, "c" * 24, "b" * 24]
+    assert "warnings" not in result
+
+
+@pytest.mark.parametrize(
+    "tri, ordre, expected",
+    [
+        ("score", "desc", ["b", "c", "a"]),
+        ("score", "asc", ["a", "c", "b"]),
+        ("date", "desc", ["c", "a", "b"]),
+    ],
+)
+def test_multi_sorted_merge(http, judilibre, tri, ordre, expected):
+    """Avec score ou date, les résultats fusionnés sont triés sur ce champ"""
+    _search_by_jurisdiction(http, {
+        "cc": [_hit("a" * 24, 1, "2022-05-01"), _hit("b" * 24, 9, "2021-01-01")],
+        "ca": [_hit("c" * 24, 5, "2024-02-01")],
+    })
+
+    result = call(
+        server.rechercher_jurisprudence_judilibre_multi,
+        recherche="bail", juridictions=["cc", "ca"], tri=tri, ordre=ordre,
+    )
+
+    assert [d["id"][0] for d in result["results"]] == expected
+
+
+def test_multi_keeps_hits_without_id(http, judilibre):
+    """Les décisions sans id ne sont pas fusionnées entre elles"""
+    _search_by_jurisdiction(http, {
+        "cc": [{"jurisdiction": "cc", "score": 2}],
+        "ca": [{"jurisdiction": "ca", "score": 1}],
+    })
+
+    result = call(
+        server.rechercher_jurisprudence_judilibre_multi, recherche="bail", juridictions=["cc", "ca"]
+    )
+
+    assert [d["jurisdiction"] for d in result["results"]] == ["cc", "ca"]
+
+
+def test_multi_reports_failed_searches(http, judilibre):
+    """Une recherche en échec est signalée dans warnings sans bloquer les autres"""
+    _search_by_jurisdiction(http, {"cc": [_hit("a" * 24, 1)]})
+
+    result = call(
+        server.rechercher_jurisprudence_judilibre_multi, recherche="bail", juridictions=["cc", "tj"]
+    )
+
+    assert [d["id"] for d in result["results"]] == ["a" * 24]
+    assert result["warnings"] == ["Recherche échouée pour juridiction=tj, chambre=None"]
+
+
+# ============================================================================
+# VALIDATION DES IDENTIFIANTS LÉGIFRANCE
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "id_",
+    [
+        "LEGIARTI000006419292",
+        "LEGISCTA000006136059",
+        "LEGITEXT000006070721",
+        "LEGITEXT000006069565_31-12-2006",
+        "JORFTEXT000000886460",
+        "JORFARTI000002433011",
+        "JORFDOLE000041746313",
+        "KALITEXT000005679900",
+        "KALICONT000005635221",
+        "CNILTEXT000017653020",
+        "JURITEXT000007020286",
+        "CETATEXT000007617000",
+        "CONSTEXT000017667380",
+        "ACCOTEXT000037731479",
+        " LEGIARTI000006419292 ",
+    ],
+)
+def test_legifrance_valid_ids_are_consulted(legifrance, monkeypatch, id_):
+    """Les identifiants Légifrance réels de toutes les bases sont transmis à l'API"""
+    monkeypatch.setattr(legifrance, "consult", lambda id_: {"id": id_})
+
+    assert call(server.consulter_legifrance, id=id_) == {"id": id_.strip()}
+
+
+@pytest.mark.parametrize(
+    "id_",
+    [
+        "1240",
+        "Article 1240",
+        "LEGIARTI",
+        "legiarti000006419292",
+        "LEGI000006419292",
+        "LEGIARTI000006419292/../x",
+        "LEGIARTI000006419292_31/12/2006",
+    ],
+)
+def test_legifrance_malformed_ids_are_rejected(legifrance, monkeypatch, id_):
+    """Un identifiant mal formé est rejeté sans appel à l'API"""
+    monkeypatch.setattr(legifrance, "consult", lambda id_: pytest.fail("appel inattendu"))
+
+    result = call(server.consulter_legifrance, id=id_)
+
+    assert result["erreur"].startswith("Format d'ID invalide")
+
+
+# ============================================================================
+# FORME DES RÉSULTATS LÉGIFRANCE
+# ============================================================================
+
+LEGIFRANCE_SEARCH = {
+    "results": [{"id": "LEGIARTI000006419292", "title": "Article 1240", "nature": "CODE"}],
+    "totalResultNumber": 42,
+    "pageNumber": 1,
+}
+
+
+def test_legifrance_search_keeps_top_level_keys(legifrance, monkeypatch):
+    """Le nombre total de résultats et la pagination restent à côté de results/warnings"""
+    monkeypatch.setattr(legifrance, "search", lambda **kwargs: LEGIFRANCE_SEARCH)
+
+    result = call(server.rechercher_legifrance, recherche="responsabilité", champs=["id"])
+
+    assert result == {
+        "results": [{"id": "LEGIARTI000006419292"}],
+        "warnings": None,
+        "totalResultNumber": 42,
+        "pageNumber": 1,
+    }
+
+
+def test_legifrance_search_and_consult_keeps_top_level_keys(legifrance, monkeypatch):
+    """L'outil composé conserve aussi les clés de premier niveau de la recherche"""
+    monkeypatch.setattr(legifrance, "search", lambda **kwargs: LEGIFRANCE_SEARCH)
+    monkeypatch.setattr(server, "_consulter_legifrance_safe", lambda id_: {"texte": "..."})
+
+    result = call(server.rechercher_et_consulter_legifrance, recherche="responsabilité")
+
+    assert result["totalResultNumber"] == 42
+    assert result["warnings"] is None
+    assert result["results"][0]["contenu"] == {"texte": "..."}
+
+
+@pytest.mark.parametrize("tool", ["rechercher_legifrance", "rechercher_et_consulter_legifrance"])
+def test_legifrance_search_error_keeps_shape(legifrance, monkeypatch, tool):
+    """En cas d'échec, results reste indexable et l'erreur est signalée"""
+    def search(**kwargs):
+        raise Exception("Erreur HTTP 500")
+
+    monkeypatch.setattr(legifrance, "search", search)
+
+    result = call(getattr(server, tool), recherche="responsabilité")
+
+    assert result == {
+        "results": [],
+        "warnings": ["Erreur lors de la recherche"],
+        "erreur": "Erreur lors de la recherche",
+    }
+
+
+# ============================================================================
+# CACHE NÉGATIF DES RECHERCHES LÉGIFRANCE
+# ============================================================================
+
+
+def test_legifrance_empty_search_is_cached(http, legifrance):
+    """Une recherche sans résultat n'est pas relancée pendant la durée du cache"""
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/search", json={"results": []})
+
+    first = call(server.rechercher_legifrance, recherche="zzzz")
+    second = call(server.rechercher_legifrance, recherche="zzzz")
+
+    assert first == second == {"results": [], "warnings": None}
+    assert len(_calls(http, "/search")) == 1
+
+
+def test_legifrance_client_error_is_cached_with_its_message(http, legifrance):
+    """Une erreur 4xx est mise en cache et relevée avec le message d'origine"""
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/search", status=400, json={"message": "bad"})
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="Erreur HTTP 400") as excinfo:
+            server._rechercher_legifrance("bail")
+        assert "Message: bad" in str(excinfo.value)
+
+    assert len(_calls(http, "/search")) == 1
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        pytest.param({"status": 503, "json": {}}, id="server_error"),
+        pytest.param({"body": requests.exceptions.ConnectionError("connexion refusée")}, id="network"),
+    ],
+)
+def test_legifrance_transient_error_is_not_cached(http, legifrance, response):
+    """Une erreur transitoire (5xx, réseau) n'est pas mise en cache : la recherche est relancée"""
+    # Pas de nouvel essai automatique : chaque appel du test correspond à une requête
+    legifrance.session.get_adapter("https://").max_retries = Retry(0, raise_on_status=False)
+    http.add(responses.POST, f"{LEGIFRANCE_URL}/search", **response)
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="Erreur lors de la recherche"):
+            server._rechercher_legifrance("bail")
+
+    assert len(_calls(http, "/search")) == 2
+
+
+# ============================================================================
+# TAMPON DES LOGS RÉCENTS
+# ============================================================================
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_log_buffer_handler_is_opt_in(enabled):
+    """Le tampon logs://recent n'est installé qu'avec DROIT_FRANCAIS_MCP_LOG_BUFFER=1"""
+    env = {k: v for k, v in os.environ.items() if k != "DROIT_FRANCAIS_MCP_LOG_BUFFER"}
+    if enabled:
+        env["DROIT_FRANCAIS_MCP_LOG_BUFFER"] = "1"
+    script = (
+        "import logging, droit_francais_MCP as s\n"
+        "logging.getLogger('test').warning('message test')\n"
+        "print(sorted(type(h).__name__ for h in logging.getLogger().handlers))\n"
+        "print(s.logs_recents.fn())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    handlers, recent = result.stdout.split("\n", 1)
+    assert ("RingHandler" in handlers) is enabled
+    assert ("message test" in recent) is enabled
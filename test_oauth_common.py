@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests OAuth communs aux clients Légifrance et JudiLibre.
+Les deux clients partagent le même mécanisme d'authentification PISTE (client_credentials) :
+les tests sont écrits une fois et exécutés pour chaque client de session (voir conftest.py).
+Ces tests utilisent l'API sandbox et nécessitent des credentials valides dans .env
+
+Pour exécuter les tests:
+    pytest test_oauth_common.py -v
+"""
+
+import pytest
+
+# Marquer tous les tests comme tests d'intégration car ils appellent l'API réelle
+# (réponses enregistrées puis rejouées par pytest-vcr, voir conftest.py)
+pytestmark = [pytest.mark.integration, pytest.mark.vcr]
+
+
+@pytest.fixture(params=["judilibre_api", "legifrance_api"])
+def api(request, judilibre_api, legifrance_api):
+    """
+    Client de session à tester (JudiLibre puis Légifrance).
+    Les deux clients sont demandés explicitement : créés avant l'ouverture de la cassette
+    du test, ils obtiennent leur token hors de toute cassette (voir conftest.py).
+    """
+    return {"judilibre_api": judilibre_api, "legifrance_api": legifrance_api}[request.param]
+
+
+def test_get_access_token(api):
+    """Test l'obtention du token d'accès OAuth"""
+    token = api.get_access_token()
+
+    assert token is not None, "Le token ne doit pas être None"
+    assert isinstance(token, str), "Le token doit être une chaîne"
+    assert len(token) > 0, "Le token ne doit pas être vide"
+    assert api.access_token == token, "Le token doit être stocké dans l'instance"
+    assert api.token_expires_at is not None, "La date d'expiration doit être définie"
+
+
+def test_token_caching(api):
+    """Test que le token est mis en cache et réutilisé"""
+    token1 = api.get_access_token()
+    token2 = api.get_access_token()
+
+    assert token1 == token2, "Le même token doit être réutilisé"
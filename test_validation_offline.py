@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests de validation des paramètres des clients Légifrance et JudiLibre
+et des identifiants de décisions acceptés par le serveur MCP.
+Les paramètres invalides sont rejetés (ValueError) avant tout appel réseau : ces tests
+utilisent des clients hors ligne (voir conftest.py) et ne demandent aucun token.
+Tout appel HTTP est de plus bloqué (fixture no_network).
+
+Pour exécuter les tests:
+    pytest test_validation_offline.py -v
+"""
+
+import pytest
+import responses
+
+import droit_francais_MCP as server
+from api_legifrance_query_builder import LegifranceQueryBuilder
+
+# Marquer tous les tests comme tests unitaires (sans réseau)
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def no_network():
+    """
+    Bloque tout appel HTTP (requests) pendant le test : aucune réponse n'étant enregistrée,
+    un appel réseau inattendu échoue immédiatement au lieu d'atteindre l'API.
+    """
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+# (méthode, paramètres, message d'erreur attendu)
+JUDILIBRE_INVALID_CALLS = [
+    pytest.param(
+        "search", {"query": "test", "operator": "invalid"}, "operator doit être",
+        id="search_invalid_operator",
+    ),
+    pytest.param(
+        "search", {"query": "test", "sort": "invalid"}, "sort doit être", id="search_invalid_sort"
+    ),
+    pytest.param(
+        "search", {"query": "test", "order": "invalid"}, "order doit être",
+        id="search_invalid_order",
+    ),
+    pytest.param(
+        "consult", {"decision_id": ""}, "L'identifiant de la décision est obligatoire",
+        id="decision_empty_id",
+    ),
+    pytest.param(
+        "consult", {"decision_id": "test_id", "query": "test", "operator": "invalid"},
+        "operator doit être", id="decision_invalid_operator",
+    ),
+    pytest.param(
+        "taxonomy", {"taxonomy_id": "jurisdiction", "key": "cc", "value": "cour de cassation"},
+        "mutuellement exclusifs", id="taxonomy_key_and_value_mutually_exclusive",
+    ),
+    pytest.param(
+        "taxonomy", {"key": "cc"}, "taxonomy_id' est requis", id="taxonomy_key_requires_id"
+    ),
+    pytest.param(
+        "taxonomy", {"value": "cour de cassation"}, "taxonomy_id' est requis",
+        id="taxonomy_value_requires_id",
+    ),
+]
+
+LEGIFRANCE_INVALID_CALLS = [
+    pytest.param(
+        "search", {"query": "test", "fond": "INVALID_FOND"}, "Fond invalide",
+        id="search_invalid_fond",
+    ),
+    pytest.param(
+        "search", {"query": "test", "search_type": "INVALID_TYPE"}, "Type de recherche invalide",
+        id="search_invalid_search_type",
+    ),
+    pytest.param(
+        "search", {"query": "test", "field_type": "INVALID_CHAMP"}, "Type de champ invalide",
+        id="search_invalid_field_type",
+    ),
+    pytest.param(
+        "search", {}, "Le paramètre 'recherche' doit être fourni", id="search_no_query"
+    ),
+    pytest.param(
+        "search", {"query": "test", "operator": "INVALID"}, "L'opérateur doit être",
+        id="search_invalid_operator",
+    ),
+]
+
+
+@pytest.mark.parametrize("method,kwargs,message", JUDILIBRE_INVALID_CALLS)
+def test_judilibre_validation(offline_judilibre_api, method, kwargs, message):
+    """Test qu'un paramètre invalide lève ValueError côté client JudiLibre"""
+
+    with pytest.raises(ValueError, match=message):
+        getattr(offline_judilibre_api, method)(**kwargs)
+
+
+@pytest.mark.parametrize("method,kwargs,message", LEGIFRANCE_INVALID_CALLS)
+def test_legifrance_validation(offline_legifrance_api, method, kwargs, message):
+    """Test qu'un paramètre invalide lève ValueError côté client Légifrance"""
+
+    with pytest.raises(ValueError, match=message):
+        getattr(offline_legifrance_api, method)(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "facette,valeurs,expected",
+    [
+        pytest.param(
+            "IDCC", ["1880", 2120, " IDCC 1486 ", "idcc:0016"], ["1880", "2120", "1486", "0016"],
+            id="idcc",
+        ),
+        pytest.param("IDCC", ["7", "12345"], ["7", "12345"], id="idcc_1_to_5_digits"),
+        pytest.param("ANNEE", [2020, " 2021 "], ["2020", "2021"], id="annee"),
+        pytest.param("NATURE", ["LOI"], ["LOI"], id="other_facet_unchanged"),
+    ],
+)
+def test_add_filtre_normalizes_numeric_facets(facette, valeurs, expected):
+    """Test que les valeurs IDCC et ANNEE sont normalisées"""
+    query_builder = LegifranceQueryBuilder().add_filtre(facette, valeurs)
+
+    assert query_builder.query["recherche"]["filtres"][-1] == {"facette": facette, "valeurs": expected}
+
+
+@pytest.mark.parametrize(
+    "facette,valeurs,rejected",
+    [
+        pytest.param("IDCC", ["1880", "IDCC 18a6"], "IDCC 18a6", id="idcc_typo"),
+        pytest.param("IDCC", ["123456"], "123456", id="idcc_too_long"),
+        pytest.param("ANNEE", ["20"], "20", id="annee_too_short"),
+    ],
+)
+def test_add_filtre_rejects_malformed_numeric_values(facette, valeurs, rejected):
+    """Test qu'une valeur IDCC ou ANNEE mal formée lève ValueError en la nommant"""
+
+    with pytest.raises(ValueError, match=f"Valeur {facette} invalide: '{rejected}'"):
+        LegifranceQueryBuilder().add_filtre(facette, valeurs)
+
+
+VALID_DECISION_IDS = [
+    "5fca7e0d4b6b4a1e8c0b0d1a",
+    "60794CFE9BA5988459C4744A",
+    " 5fca7e0d4b6b4a1e8c0b0d1a ",
+]
+
+INVALID_DECISION_IDS = [
+    pytest.param("20-12.345", id="numero_pourvoi"),
+    pytest.param("ECLI:FR:CCASS:2021:C100123", id="ecli"),
+    pytest.param("5fca7e0d 4b6b4a1e8c0b0d1a", id="espace"),
+    pytest.param("5fca7e0d", id="trop_court"),
+    pytest.param("../5fca7e0d4b6b4a1e8c0b0d1a", id="chemin"),
+]
+
+
+@pytest.mark.parametrize("decision_id", VALID_DECISION_IDS)
+def test_decision_id_valid(monkeypatch, decision_id):
+    """Test qu'un identifiant de décision bien formé est transmis à la consultation"""
+    monkeypatch.setattr(server, "_consult_decision", lambda decision_id, zones=None: {"id": decision_id})
+
+    assert server._consult_decision_safe(decision_id) == {"id": decision_id.strip()}
+
+
+@pytest.mark.parametrize("decision_id", INVALID_DECISION_IDS)
+def test_decision_id_invalid(monkeypatch, decision_id):
+    """Test qu'un identifiant de décision mal formé est rejeté sans appel à l'API"""
+    monkeypatch.setattr(server, "_consult_decision", lambda *args, **kwargs: pytest.fail("appel inattendu"))
+
+    result = server._consult_decision_safe(decision_id)
+
+    assert result["erreur"].startswith("Format d'ID invalide")